@@ -0,0 +1,273 @@
+from __future__ import annotations
+
+import asyncio
+from typing import AsyncIterator, Dict, List
+
+import attr
+import httpx
+
+from codaio.coda import (
+    HTTP2,
+    Coda,
+    _dumps,
+    _merge_pages,
+    _process_response,
+    _query_params,
+    _retry_delay,
+    _should_retry,
+)
+
+
+@attr.s(hash=True, slots=True)
+class AsyncCoda(Coda):
+    """
+    Asynchronous raw API client.
+
+    Exposes the same API methods as `Coda`, but as coroutines built on `httpx.AsyncClient`,
+    so many requests can be in flight at once:
+
+        async with AsyncCoda("YOUR_API_KEY") as coda:
+            docs, tables = await asyncio.gather(coda.list_docs(), coda.list_tables(doc_id))
+
+    Requires `httpx` to be installed. HTTP/2 is used when `h2` is installed as well.
+
+    At most `max_concurrency` requests are sent at once, others wait for a free slot.
+    Like with `Coda`, `RETRY_METHODS` requests answered with one of `RETRY_STATUSES`,
+    and POST requests answered with one of `RETRY_POST_STATUSES`,
+    are retried with exponential backoff, honouring the `Retry-After` header.
+    Unlike `Coda`, the client is closed with `await coda.aclose()` or `async with`,
+    GET responses are never cached (`cache_ttl` isn't supported)
+    and pages aren't streamed (`iter_items` doesn't support `stream`).
+    """
+
+    session: httpx.AsyncClient = attr.ib(init=False, repr=False, eq=False)
+    max_concurrency: int = attr.ib(default=8, repr=False)
+    _semaphore: asyncio.Semaphore = attr.ib(
+        init=False, default=None, repr=False, eq=False
+    )
+    _semaphore_loop: asyncio.AbstractEventLoop = attr.ib(
+        init=False, default=None, repr=False, eq=False
+    )
+
+    def _make_session(self) -> httpx.AsyncClient:
+        return httpx.AsyncClient(
+            headers=self.headers,
+            http2=HTTP2,
+            limits=httpx.Limits(
+                max_connections=self.pool_maxsize,
+                max_keepalive_connections=self.pool_maxsize,
+                keepalive_expiry=30,
+            ),
+        )
+
+    def __attrs_post_init__(self):
+        # Responses aren't cached by the async client, unlike `Coda.get`.
+        if self.cache_ttl:
+            raise ValueError("AsyncCoda doesn't support cache_ttl, use Coda to cache GETs")
+        super().__attrs_post_init__()
+
+    def __enter__(self):
+        raise TypeError("AsyncCoda is an async context manager, use `async with AsyncCoda(...)`")
+
+    def __exit__(self, *args):
+        raise TypeError("AsyncCoda is an async context manager, use `async with AsyncCoda(...)`")
+
+    def close(self):
+        raise TypeError("AsyncCoda sessions are closed with `await coda.aclose()`")
+
+    def invalidate(self, endpoint_prefix: str = None):
+        raise TypeError("AsyncCoda doesn't cache GET responses, there is nothing to invalidate")
+
+    # The synchronous request helpers of `Coda`, which would call the async session
+    # without awaiting it. `get` and `iter_items` have their own coroutine versions.
+    def _get_all_pages(self, endpoint: str, params: Dict, limit=None):
+        raise TypeError("AsyncCoda requests are coroutines, use `await coda.get(...)`")
+
+    def _iter_streamed_items(self, endpoint: str, data: Dict = None, offset=None):
+        raise TypeError("AsyncCoda doesn't stream pages, use `coda.iter_items(...)`")
+
+    async def __aenter__(self) -> AsyncCoda:
+        return self
+
+    async def __aexit__(self, *args):
+        await self.aclose()
+
+    async def aclose(self):
+        """
+        Closes the underlying HTTP connections.
+
+        :return:
+        """
+        await self.session.aclose()
+
+    async def _request(self, method: str, url: str, **kwargs) -> httpx.Response:
+        # Created on first use, and again whenever the client is used from another
+        # event loop (e.g. successive `asyncio.run` calls), so the semaphore always
+        # belongs to the running loop.
+        loop = asyncio.get_running_loop()
+        if self._semaphore is None or self._semaphore_loop is not loop:
+            self._semaphore = asyncio.Semaphore(self.max_concurrency)
+            self._semaphore_loop = loop
+
+        attempt = 0
+        while True:
+            async with self._semaphore:
+                response = await self.session.request(method, url, **kwargs)
+            if not _should_retry(response.request, response, attempt):
+                return response
+            await asyncio.sleep(_retry_delay(response, attempt))
+            attempt += 1
+
+    async def get(self, endpoint: str, data: Dict = None, limit=None, offset=None) -> Dict:
+        """
+        Makes a GET request to API endpoint.
+
+        :param endpoint: API endpoint to request
+
+        :param data: dictionary of optional query params
+
+        :param limit: Maximum number of results to return in this query.
+
+        :param offset: An opaque token used to fetch the next page of results.
+
+        :return:
+        """
+        params = _query_params(data, limit=limit, offset=offset)
+        page = await self._get_page(self.href + endpoint, params)
+        if limit or not page.get("nextPageLink"):
+            return page
+
+        pages = [page]
+        while page.get("nextPageLink"):
+            page = await self._get_page(page["nextPageLink"])
+            pages.append(page)
+        return _merge_pages(pages)
+
+    async def _get_page(self, url: str, params: Dict = None) -> Dict:
+        return _process_response(await self._request("GET", url, params=params))
+
+    async def get_many(self, endpoints: List[str], data: Dict = None) -> List[Dict]:
+        """
+        Makes GET requests to several API endpoints concurrently.
+
+        :param endpoints: API endpoints to request
+
+        :param data: dictionary of optional query params sent with every request
+
+        :return: responses in the order of `endpoints`
+        """
+        pages = await asyncio.gather(*(self.get(endpoint, data) for endpoint in endpoints))
+        return list(pages)
+
+    async def iter_pages(
+        self, endpoint: str, data: Dict = None, offset=None, prefetch: bool = False
+    ) -> AsyncIterator[Dict]:
+        """
+        Iterates over the pages of a paginated API endpoint.
+
+        :param endpoint: API endpoint to request
+
+        :param data: dictionary of optional query params
+
+        :param offset: An opaque token used to fetch the next page of results.
+
+        :param prefetch: Request the next page while the current one is being consumed.
+
+        :return:
+        """
+        params = _query_params(data, offset=offset)
+        page = await self._get_page(self.href + endpoint, params)
+        while page.get("nextPageLink"):
+            if prefetch:
+                next_page = asyncio.ensure_future(self._get_page(page["nextPageLink"]))
+                try:
+                    yield page
+                except BaseException:
+                    next_page.cancel()
+                    raise
+                page = await next_page
+            else:
+                yield page
+                page = await self._get_page(page["nextPageLink"])
+        yield page
+
+    async def iter_items(
+        self,
+        endpoint: str,
+        data: Dict = None,
+        offset=None,
+        prefetch: bool = False,
+        stream: bool = False,
+    ) -> AsyncIterator[Dict]:
+        """
+        Iterates over the items of a paginated API endpoint.
+
+        :param endpoint: API endpoint to request
+
+        :param data: dictionary of optional query params
+
+        :param offset: An opaque token used to fetch the next page of results.
+
+        :param prefetch: Request the next page while the current one is being consumed.
+
+        :param stream: Not supported, pages are always parsed whole.
+            Accepted for compatibility with `Coda.iter_items`, raises `ValueError` if set.
+
+        :return:
+        """
+        if stream:
+            raise ValueError("AsyncCoda doesn't stream pages, iterate without `stream`")
+
+        async for page in self.iter_pages(
+            endpoint, data=data, offset=offset, prefetch=prefetch
+        ):
+            for item in page.get("items", []):
+                yield item
+
+    async def post(self, endpoint: str, data: Dict) -> Dict:
+        """
+        Makes a POST request to the API endpoint.
+
+        :param endpoint: API endpoint to request
+
+        :param data: data dict to be sent as body json
+
+        :return:
+        """
+        response = await self._request(
+            "POST", self.href + endpoint, content=_dumps(data)
+        )
+        return _process_response(response)
+
+    async def put(self, endpoint: str, data: Dict) -> Dict:
+        """
+        Makes a PUT request to the API endpoint.
+
+        :param endpoint: API endpoint to request
+
+        :param data: data dict to be sent as body json
+
+        :return:
+        """
+        response = await self._request(
+            "PUT", self.href + endpoint, content=_dumps(data)
+        )
+        return _process_response(response)
+
+    async def delete(self, endpoint: str, data: Dict = None) -> Dict:
+        """
+        Makes a DELETE request to the API endpoint.
+
+        :param endpoint: API endpoint to request
+
+        :param data: data dict to be sent as body json
+
+        :return:
+        """
+        if data is not None:
+            response = await self._request(
+                "DELETE", self.href + endpoint, content=_dumps(data)
+            )
+        else:
+            response = await self._request("DELETE", self.href + endpoint)
+        return _process_response(response)
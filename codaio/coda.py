@@ -1,14 +1,19 @@
 from __future__ import annotations
 
+import copy
 import datetime as dt
 import json
+import sys
 import time
-from typing import Any, Dict, List, Tuple, Union
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache, wraps
+from itertools import chain, islice
+from typing import Any, AsyncIterator, Dict, Iterator, List, Tuple, Union
+from urllib.parse import quote, urlencode
 
 import attr
 import inflection
 from dateutil.parser import parse
-from decorator import decorator
 import warnings
 from envparse import env
 
@@ -28,58 +33,338 @@ else:
     except ImportError:
         import requests
 
+if requests.__name__ == "requests":
+    from requests.adapters import HTTPAdapter
+    from urllib3.util.retry import Retry
+
+try:
+    import httpx
+except ImportError:
+    httpx = None
+
+try:
+    import ijson
+except ImportError:
+    ijson = None
+
+try:
+    import h2  # noqa: F401  (enables HTTP/2 in httpx)
+
+    HTTP2 = True
+except ImportError:
+    HTTP2 = False
+
+try:
+    import orjson
+
+    _loads = orjson.loads
+    _dumps = orjson.dumps
+except ImportError:
+    _loads = json.loads
+
+    def _dumps(data) -> bytes:
+        return json.dumps(data).encode()
+
 
 MAX_GET_LIMIT = 200
 
+# Status codes worth retrying: rate limiting and transient server errors.
+RETRY_STATUSES = (429, 500, 502, 503, 504)
+# Reads, row updates (PUT) and deletions are idempotent: repeating one that already
+# succeeded on the server changes nothing, so they are retried on any of RETRY_STATUSES.
+# POST isn't idempotent and has its own, narrower rule below.
+RETRY_METHODS = ("GET", "PUT", "DELETE")
+# POST /rows without `keyColumns` inserts rows, and a request failing with a server error
+# may already have been applied: POST is only retried when rate limited (429),
+# as the API rejects such requests before doing anything.
+RETRY_POST_STATUSES = (429,)
+RETRY_TOTAL = 5
+RETRY_BACKOFF = 0.3
 
-@decorator
-def handle_response(func, *args, **kwargs) -> Dict:
-    response = func(*args, **kwargs)
 
-    if isinstance(response, List):
-        res = {}
-        items = []
-        for r in response:
-            if r.json().get("items"):
-                items.extend(r.json().pop("items"))
+def _is_retryable(method: str, status_code: int) -> bool:
+    if method in RETRY_METHODS:
+        return status_code in RETRY_STATUSES
+    return method == "POST" and status_code in RETRY_POST_STATUSES
+
+
+if requests.__name__ == "requests":
+
+    class _Retry(Retry):
+        """urllib3 `Retry` that decides on response statuses with `_is_retryable`."""
+
+        def is_retry(self, method: str, status_code: int, has_retry_after: bool = False):
+            return _is_retryable(method, status_code)
+
+
+def _retry_delay(response: httpx.Response, attempt: int) -> float:
+    try:
+        return float(response.headers["Retry-After"])
+    except (KeyError, ValueError):
+        return RETRY_BACKOFF * 2 ** attempt
+
+
+def _should_retry(request: httpx.Request, response: httpx.Response, attempt: int) -> bool:
+    return attempt < RETRY_TOTAL and _is_retryable(request.method, response.status_code)
+
+
+if httpx is not None:
+
+    class RetryTransport(httpx.BaseTransport):
+        """
+        Synchronous `httpx` transport retrying requests like the `requests` session of `Coda`.
+
+        Used by `Coda` with `USE_HTTPX`, so that switching to HTTP/2 keeps the handling
+        of rate limits: `RETRY_METHODS` requests answered with one of `RETRY_STATUSES`,
+        and POST requests answered with one of `RETRY_POST_STATUSES`,
+        are retried with exponential backoff, honouring the `Retry-After` header.
+        """
+
+        def __init__(self, transport: httpx.BaseTransport):
+            self.transport = transport
+
+        def handle_request(self, request: httpx.Request) -> httpx.Response:
+            attempt = 0
+            response = self.transport.handle_request(request)
+            while _should_retry(request, response, attempt):
+                response.close()
+                time.sleep(_retry_delay(response, attempt))
+                attempt += 1
+                response = self.transport.handle_request(request)
+            return response
+
+        def close(self):
+            self.transport.close()
+
+
+@lru_cache(maxsize=256)
+def _underscore(key: str) -> str:
+    """API objects share a small set of camelCase keys, so each is converted only once."""
+    return inflection.underscore(key)
+
+
+# Keys of the API objects codaio models, resolved without going through `inflection`.
+_KEYMAP = {
+    key: inflection.underscore(key)
+    for key in [
+        "id",
+        "type",
+        "href",
+        "name",
+        "index",
+        "values",
+        "display",
+        "calculated",
+        "formula",
+        "defaultValue",
+        "browserLink",
+        "createdAt",
+        "updatedAt",
+        "displayColumn",
+        "rowCount",
+        "sorts",
+        "layout",
+        "tableType",
+        "filter",
+        "parentTable",
+        "viewId",
+        "parent",
+        "format",
+    ]
+}
+
+
+def _convert_keys(js: Dict) -> Dict:
+    """Converts the camelCase keys of an API object to snake_case."""
+    return {_KEYMAP.get(k) or _underscore(k): v for k, v in js.items()}
+
+
+# `datetime.fromisoformat` accepts the trailing "Z" of UTC timestamps since Python 3.11.
+_FROMISOFORMAT_Z = sys.version_info >= (3, 11)
+
+
+def _parse_datetime(value: str) -> dt.datetime:
+    """
+    Parses a timestamp returned by the API.
+
+    Coda returns ISO 8601 timestamps, which `datetime.fromisoformat` parses far faster
+    than `dateutil`. Anything it can't handle falls back to `dateutil.parser.parse`.
+    """
+    if not _FROMISOFORMAT_Z and value.endswith("Z"):
+        value = value[:-1] + "+00:00"
+    try:
+        return dt.datetime.fromisoformat(value)
+    except ValueError:
+        return parse(value)
+
+
+def _parse_optional_datetime(value: str = None) -> dt.datetime:
+    return _parse_datetime(value) if value else None
+
+
+def _values_to_dict(values: Union[Dict, Tuple[Tuple]]) -> Dict:
+    # The values of rows built from the API are used as is, without a copy.
+    return values if isinstance(values, dict) else dict(values)
+
+
+def _cells_json(cells: List[Cell]) -> List[Dict]:
+    """
+    Request payload for a list of `Cell` objects.
+
+    Uses `Cell.column_id_or_name`, so writing cells never resolves their columns.
+    """
+    return [
+        {
+            "column": cell.column_id_or_name,
+            "value": cell.value_storage,
+        }
+        for cell in cells
+    ]
+
+
+@lru_cache(maxsize=1024)
+def _quote(identifier: str) -> str:
+    """
+    URL-encodes an ID or name for use in an endpoint path.
+
+    `%` is kept as is, so names that are URI-encoded already are sent unchanged.
+    The same IDs are used for every row of a table, so each is encoded only once.
+    """
+    return quote(str(identifier), safe="%")
+
+
+@lru_cache(maxsize=256)
+def _table_endpoint(doc_id: str, table_id_or_name: str) -> str:
+    return f"/docs/{_quote(doc_id)}/tables/{_quote(table_id_or_name)}"
+
+
+def _key_column_id(key_column: Union[str, Column]) -> str:
+    if isinstance(key_column, Column):
+        return key_column.id
+    if isinstance(key_column, str):
+        return key_column
+    raise err.ColumnNotFound(f"Invalid parameter: '{key_column}' in key_columns.")
+
+
+def _column_id_or_name(column: Union[str, Column]) -> str:
+    """A cell's column as sent to the API, whether or not it was resolved to a `Column`."""
+    if isinstance(column, Column):
+        return column.id
+    return column
+
+
+def _doc_scope(endpoint: str) -> Union[str, None]:
+    """The `/docs/{doc_id}` an endpoint belongs to, None for endpoints outside any doc."""
+    parts = endpoint.split("?", 1)[0].split("/")
+    if len(parts) > 2 and parts[1] == "docs" and parts[2]:
+        return f"/docs/{parts[2]}"
+    return None
 
-            res.update(r.json())
-        if items:
-            res["items"] = items
-        return res
 
+def _query_params(data: Dict = None, limit: int = None, offset: str = None) -> Dict:
+    params = dict(data) if data else {}
+    if limit:
+        params["limit"] = min(limit, MAX_GET_LIMIT)
+    if offset:
+        params["pageToken"] = offset
+    return params
+
+
+def _merge_pages(pages: List[Dict]) -> Dict:
+    """
+    Joins the pages of a listing into one response with the items of all pages.
+
+    The envelope of the last page is kept, so the result has no `nextPageLink`.
+    """
+    items = []
+    for page in pages:
+        items.extend(page.get("items") or ())
+    res = pages[-1]
+    res["items"] = items
+    return res
+
+
+def _process_response(response) -> Dict:
     if 200 <= response.status_code <= 299:
-        if not response.json():
+        if response.status_code == 204 or not response.content:
             return {"status": response.status_code}
-        return response.json()
+        return _loads(response.content) or {"status": response.status_code}
 
     error_dict = {404: err.NotFound}
+    error = error_dict.get(response.status_code, err.CodaError)
 
-    if response.status_code in error_dict:
-        raise error_dict[response.status_code](
-            f'Status code: {response.status_code}. Message: {response.json()["message"]}'
-        )
+    try:
+        message = _loads(response.content)["message"]
+    except (ValueError, KeyError, TypeError):
+        message = response.text
+    raise error(f"Status code: {response.status_code}. Message: {message}")
+
+
+def _iter_json_events(response, chunk_size: int = 64 * 1024) -> Iterator[Tuple]:
+    """Yields `ijson` parser events for the body of a streamed response as it arrives."""
+    events = ijson.sendable_list()
+    parser = ijson.parse_coro(events, use_float=True)
+    for chunk in response.iter_content(chunk_size=chunk_size):
+        parser.send(chunk)
+        yield from events
+        del events[:]
+    parser.close()
+    yield from events
+
+
+def _json_body(data: Dict) -> Dict:
+    """Request keyword arguments sending `data` as a JSON body serialized with `_dumps`."""
+    if requests.__name__ == "httpx":
+        return {"content": _dumps(data)}
+    return {"data": _dumps(data)}
+
+
+def _environment_api_key() -> str:
+    api_key = env("CODA_API_KEY", cast=str, default=None)
+    if not api_key:
+        raise err.NoApiKey("CODA_API_KEY environment variable is not set")
+    return api_key
 
-    raise err.CodaError(
-        f'Status code: {response.status_code}. Message: {response.json()["message"]}'
-    )
 
+def handle_response(func):
+    @wraps(func)
+    def wrapper(*args, **kwargs) -> Dict:
+        return _process_response(func(*args, **kwargs))
 
-@attr.s(hash=True)
+    return wrapper
+
+
+@attr.s(hash=True, slots=True)
 class Coda:
     """
     Raw API client.
 
     It is used in `codaio` objects like Document to access the raw API endpoints.
     Can also be used by itself to access Raw API.
+
+    Pass `cache_ttl` (seconds) to cache GET responses: repeated reads of the same
+    endpoint with the same params are served from memory until they expire.
+    A POST, PUT or DELETE made through the client drops the cached responses of the doc
+    it changes and those outside any doc (like the doc listing); one outside any doc
+    empties the cache. Use `invalidate` to drop entries after changes made elsewhere.
+
+    `pool_maxsize` is the number of connections to the API kept open for reuse,
+    raise it if more requests than that run concurrently.
     """
 
     api_key: str = attr.ib(repr=False)
     authorization: Dict = attr.ib(init=False, repr=False)
+    headers: Dict = attr.ib(init=False, repr=False, eq=False)
+    session: requests.Session = attr.ib(init=False, repr=False, eq=False)
     href: str = attr.ib(
         repr=False,
         default=env("CODA_API_ENDPOINT", cast=str, default="https://coda.io/apis/v1"),
     )
+    cache_ttl: float = attr.ib(default=None, repr=False)
+    pool_maxsize: int = attr.ib(default=64, repr=False)
+    _cache: Dict[Tuple[str, str], Tuple[float, Dict]] = attr.ib(
+        init=False, factory=dict, repr=False, eq=False
+    )
 
     @classmethod
     def from_environment(cls) -> Coda:
@@ -88,13 +373,76 @@ class Coda:
 
         :return:
         """
-        api_key = env("CODA_API_KEY", cast=str)
-        return cls(api_key=api_key)
+        return cls(api_key=_environment_api_key())
 
     def __attrs_post_init__(self):
         self.authorization = {"Authorization": f"Bearer {self.api_key}"}
+        self.headers = {**self.authorization, "Content-Type": "application/json"}
+        self.session = self._make_session()
+
+    def __enter__(self) -> Coda:
+        return self
+
+    def __exit__(self, *args):
+        self.close()
+
+    def close(self):
+        """
+        Closes the HTTP session and releases its pooled connections.
+
+        :return:
+        """
+        self.session.close()
+
+    def _make_session(self):
+        """
+        Creates the HTTP session shared by all requests of this client.
+
+        Keeping one session keeps connections to the API alive between calls,
+        so consecutive requests (e.g. pages of a listing) skip the TCP and TLS handshakes.
+        The Authorization and Content-Type headers are set on the session once
+        instead of per request.
+        With `USE_HTTPX`, requests go over HTTP/2 when the `h2` package is installed.
+
+        `RETRY_METHODS` requests answered with one of `RETRY_STATUSES`, and POST requests
+        answered with one of `RETRY_POST_STATUSES`, are retried with exponential backoff,
+        honouring the `Retry-After` header of 429 responses.
+        If retries run out, the last response is handled as usual and raises `CodaError`.
+
+        :return:
+        """
+        if requests.__name__ == "httpx":
+            transport = requests.HTTPTransport(
+                http2=HTTP2,
+                limits=requests.Limits(
+                    max_connections=self.pool_maxsize,
+                    max_keepalive_connections=self.pool_maxsize,
+                    keepalive_expiry=30,
+                ),
+            )
+            return requests.Client(
+                headers=self.headers, transport=RetryTransport(transport)
+            )
+
+        session = requests.Session()
+        session.headers.update(self.headers)
+        # Only `RETRY_METHODS` are retried after connection errors, POST never is.
+        retry = _Retry(
+            total=RETRY_TOTAL,
+            backoff_factor=RETRY_BACKOFF,
+            status_forcelist=RETRY_STATUSES,
+            allowed_methods=RETRY_METHODS,
+            respect_retry_after_header=True,
+            raise_on_status=False,
+        )
+        # The client talks to one or two hosts, so few pools with many connections each.
+        adapter = HTTPAdapter(
+            max_retries=retry, pool_connections=4, pool_maxsize=self.pool_maxsize
+        )
+        session.mount("https://", adapter)
+        session.mount("http://", adapter)
+        return session
 
-    @handle_response
     def get(self, endpoint: str, data: Dict = None, limit=None, offset=None) -> Dict:
         """
         Makes a GET request to API endpoint.
@@ -109,26 +457,198 @@ class Coda:
 
         :return:
         """
-        if not data:
-            data = {}
-        if limit:
-            if limit > MAX_GET_LIMIT:
-                limit = MAX_GET_LIMIT
-            data["limit"] = limit
-
-        if offset:
-            data["pageToken"] = offset
-        r = requests.get(self.href + endpoint, params=data, headers=self.authorization)
-        if limit or not r.json().get("nextPageLink"):
-            return r
-
-        res = [r]
-        while r.json().get("nextPageLink"):
-            next_page = r.json()["nextPageLink"]
-            r = requests.get(next_page, headers=self.authorization)
-            res.append(r)
+        params = _query_params(data, limit=limit, offset=offset)
+        if not self.cache_ttl:
+            return self._get_all_pages(endpoint, params, limit)
+
+        key = (endpoint, urlencode(sorted(params.items()), doseq=True))
+        cached = self._cache.get(key)
+        if cached and time.monotonic() - cached[0] < self.cache_ttl:
+            return copy.deepcopy(cached[1])
+
+        res = self._get_all_pages(endpoint, params, limit)
+        self._cache[key] = (time.monotonic(), copy.deepcopy(res))
         return res
 
+    def _get_all_pages(self, endpoint: str, params: Dict, limit=None) -> Dict:
+        page = self._get_page(self.href + endpoint, params)
+        if limit or not page.get("nextPageLink"):
+            return page
+
+        pages = [page]
+        while page.get("nextPageLink"):
+            page = self._get_page(page["nextPageLink"])
+            pages.append(page)
+        return _merge_pages(pages)
+
+    def invalidate(self, endpoint_prefix: str = None):
+        """
+        Drops cached GET responses, see `cache_ttl`.
+
+        :param endpoint_prefix: only drop endpoints starting with this prefix,
+            e.g. `/docs/AbCDeFGH/tables`. Drops everything if omitted.
+
+        :return:
+        """
+        if endpoint_prefix is None:
+            self._cache.clear()
+            return
+
+        for key in [key for key in self._cache if key[0].startswith(endpoint_prefix)]:
+            self._cache.pop(key, None)
+
+    def _invalidate_mutated(self, endpoint: str):
+        # A change within a doc only affects that doc's responses and the ones outside
+        # any doc (e.g. the doc listing), so other docs stay cached.
+        scope = _doc_scope(endpoint)
+        if scope is None:
+            self.invalidate()
+            return
+
+        for key in [key for key in self._cache if _doc_scope(key[0]) in (None, scope)]:
+            self._cache.pop(key, None)
+
+    def get_page(
+        self, endpoint: str, data: Dict = None, limit=None, offset=None
+    ) -> Dict:
+        """
+        Makes a single GET request to a paginated API endpoint.
+
+        Unlike `get`, the page is returned as is, including its `nextPageToken`.
+        Pass that token as `offset` to fetch the next page, e.g. to resume an export.
+        The page is never served from the GET cache.
+
+        :param endpoint: API endpoint to request
+
+        :param data: dictionary of optional query params
+
+        :param limit: Maximum number of results to return in this page.
+
+        :param offset: An opaque token used to fetch the next page of results.
+
+        :return:
+        """
+        params = _query_params(data, limit=limit, offset=offset)
+        return self._get_page(self.href + endpoint, params)
+
+    @handle_response
+    def _get_page(self, url: str, params: Dict = None) -> Dict:
+        return self.session.get(url, params=params)
+
+    def get_many(
+        self, endpoints: List[str], data: Dict = None, max_workers: int = 8
+    ) -> List[Dict]:
+        """
+        Makes GET requests to several API endpoints concurrently.
+
+        Pages of a single endpoint are linked by `nextPageLink` and can only be fetched
+        one after another, but independent endpoints (e.g. the columns of every table)
+        don't have to wait for each other.
+
+        :param endpoints: API endpoints to request
+
+        :param data: dictionary of optional query params sent with every request
+
+        :param max_workers: Maximum number of concurrent requests.
+
+        :return: responses in the order of `endpoints`
+        """
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            return list(executor.map(lambda e: self.get(e, data), endpoints))
+
+    def iter_pages(
+        self, endpoint: str, data: Dict = None, offset=None, prefetch: bool = False
+    ) -> Iterator[Dict]:
+        """
+        Iterates over the pages of a paginated API endpoint.
+
+        Pages are requested one at a time as the iterator is consumed.
+
+        :param endpoint: API endpoint to request
+
+        :param data: dictionary of optional query params
+
+        :param offset: An opaque token used to fetch the next page of results.
+
+        :param prefetch: Request the next page in a background thread
+            while the current one is being consumed.
+
+        :return:
+        """
+        params = _query_params(data, offset=offset)
+        page = self._get_page(self.href + endpoint, params)
+        if not prefetch:
+            yield page
+            while page.get("nextPageLink"):
+                page = self._get_page(page["nextPageLink"])
+                yield page
+            return
+
+        with ThreadPoolExecutor(max_workers=1) as executor:
+            while page.get("nextPageLink"):
+                next_page = executor.submit(self._get_page, page["nextPageLink"])
+                yield page
+                page = next_page.result()
+            yield page
+
+    def iter_items(
+        self,
+        endpoint: str,
+        data: Dict = None,
+        offset=None,
+        prefetch: bool = False,
+        stream: bool = False,
+    ) -> Iterator[Dict]:
+        """
+        Iterates over the items of a paginated API endpoint.
+
+        Unlike `get`, pages are requested one at a time as the iterator is consumed,
+        so only one page of results is held in memory.
+
+        :param endpoint: API endpoint to request
+
+        :param data: dictionary of optional query params
+
+        :param offset: An opaque token used to fetch the next page of results.
+
+        :param prefetch: Request the next page in a background thread
+            while the items of the current one are being consumed.
+
+        :param stream: Parse each page incrementally with `ijson` and yield items
+            while the page is still downloading, so memory stays proportional to one item.
+            Ignored (falls back to regular pages) if `ijson` isn't installed
+            or the client uses `httpx`. Can't be combined with `prefetch`.
+
+        :return:
+        """
+        if stream and ijson is not None and requests.__name__ == "requests":
+            yield from self._iter_streamed_items(endpoint, data=data, offset=offset)
+            return
+
+        for page in self.iter_pages(endpoint, data=data, offset=offset, prefetch=prefetch):
+            yield from page.get("items", [])
+
+    def _iter_streamed_items(
+        self, endpoint: str, data: Dict = None, offset=None
+    ) -> Iterator[Dict]:
+        url, params = self.href + endpoint, _query_params(data, offset=offset)
+        while url:
+            with self.session.get(url, params=params, stream=True) as response:
+                if not 200 <= response.status_code <= 299:
+                    _process_response(response)
+
+                url, params, builder = None, None, None
+                for prefix, event, value in _iter_json_events(response):
+                    if prefix == "nextPageLink":
+                        url = value
+                    elif prefix.startswith("items.item"):
+                        if builder is None:
+                            builder = ijson.ObjectBuilder()
+                        builder.event(event, value)
+                        if prefix == "items.item" and event == "end_map":
+                            yield builder.value
+                            builder = None
+
     # noinspection PyTypeChecker
     @handle_response
     def post(self, endpoint: str, data: Dict) -> Dict:
@@ -141,11 +661,8 @@ class Coda:
 
         :return:
         """
-        return requests.post(
-            self.href + endpoint,
-            json=data,
-            headers={**self.authorization, "Content-Type": "application/json"},
-        )
+        self._invalidate_mutated(endpoint)
+        return self.session.post(self.href + endpoint, **_json_body(data))
 
     # noinspection PyTypeChecker
     @handle_response
@@ -159,7 +676,8 @@ class Coda:
 
         :return:
         """
-        return requests.put(self.href + endpoint, json=data, headers=self.authorization)
+        self._invalidate_mutated(endpoint)
+        return self.session.put(self.href + endpoint, **_json_body(data))
 
     # noinspection PyTypeChecker
     @handle_response
@@ -173,12 +691,13 @@ class Coda:
 
         :return:
         """
+        self._invalidate_mutated(endpoint)
         if data is not None:
-            return requests.delete(
-                self.href + endpoint, json=data, headers=self.authorization
+            return self.session.request(
+                "DELETE", self.href + endpoint, **_json_body(data)
             )
 
-        return requests.delete(self.href + endpoint, headers=self.authorization)
+        return self.session.delete(self.href + endpoint)
 
     def list_docs(
         self,
@@ -247,7 +766,7 @@ class Coda:
 
         :return:
         """
-        return self.get("/docs/" + doc_id)
+        return self.get("/docs/" + _quote(doc_id))
 
     def delete_doc(self, doc_id: str) -> Dict:
         """
@@ -259,7 +778,7 @@ class Coda:
 
         :return:
         """
-        return self.delete("/docs/" + doc_id)
+        return self.delete("/docs/" + _quote(doc_id))
 
     def list_sections(self, doc_id: str, offset: int = None, limit: int = None) -> Dict:
         """
@@ -275,7 +794,7 @@ class Coda:
 
         :return:
         """
-        return self.get(f"/docs/{doc_id}/pages", offset=offset, limit=limit)
+        return self.get(f"/docs/{_quote(doc_id)}/pages", offset=offset, limit=limit)
 
     def get_section(self, doc_id: str, section_id_or_name: str) -> Dict:
         """
@@ -291,7 +810,7 @@ class Coda:
 
         :return:
         """
-        return self.get(f"/docs/{doc_id}/pages/{section_id_or_name}")
+        return self.get(f"/docs/{_quote(doc_id)}/pages/{_quote(section_id_or_name)}")
 
     def list_folders(self, doc_id: str, offset: int = None, limit: int = None) -> Dict:
         """
@@ -307,7 +826,7 @@ class Coda:
 
         :return:
         """
-        return self.get(f"/docs/{doc_id}/folders", offset=offset, limit=limit)
+        return self.get(f"/docs/{_quote(doc_id)}/folders", offset=offset, limit=limit)
 
     def get_folder(self, doc_id: str, folder_id_or_name: str) -> Dict:
         """
@@ -324,7 +843,7 @@ class Coda:
 
         :return:
         """
-        return self.get(f"/docs/{doc_id}/folders/{folder_id_or_name}")
+        return self.get(f"/docs/{_quote(doc_id)}/folders/{_quote(folder_id_or_name)}")
 
     def list_tables(self, doc_id: str, offset: int = None, limit: int = None) -> Dict:
         """
@@ -340,7 +859,7 @@ class Coda:
 
         :return:
         """
-        return self.get(f"/docs/{doc_id}/tables", offset=offset, limit=limit)
+        return self.get(f"/docs/{_quote(doc_id)}/tables", offset=offset, limit=limit)
 
     def get_table(self, doc_id: str, table_id_or_name: str) -> Dict:
         """
@@ -356,7 +875,7 @@ class Coda:
 
         :return:
         """
-        return self.get(f"/docs/{doc_id}/tables/{table_id_or_name}")
+        return self.get(_table_endpoint(doc_id, table_id_or_name))
 
     def list_views(self, doc_id: str, offset: int = None, limit: int = None) -> Dict:
         """
@@ -373,7 +892,7 @@ class Coda:
         :return:
         """
         return self.get(
-            f"/docs/{doc_id}/tables?tableTypes=view", offset=offset, limit=limit
+            f"/docs/{_quote(doc_id)}/tables?tableTypes=view", offset=offset, limit=limit
         )
 
     def get_view(self, doc_id: str, view_id_or_name: str) -> Dict:
@@ -390,7 +909,7 @@ class Coda:
 
         :return:
         """
-        return self.get(f"/docs/{doc_id}/tables/{view_id_or_name}")
+        return self.get(_table_endpoint(doc_id, view_id_or_name))
 
     def list_columns(
         self, doc_id: str, table_id_or_name: str, offset: int = None, limit: int = None
@@ -411,7 +930,7 @@ class Coda:
         :return:
         """
         return self.get(
-            f"/docs/{doc_id}/tables/{table_id_or_name}/columns",
+            _table_endpoint(doc_id, table_id_or_name) + "/columns",
             offset=offset,
             limit=limit,
         )
@@ -436,9 +955,8 @@ class Coda:
 
         :return:
         """
-        return self.get(
-            f"/docs/{doc_id}/tables/{table_id_or_name}/columns/{column_id_or_name}"
-        )
+        endpoint = _table_endpoint(doc_id, table_id_or_name)
+        return self.get(f"{endpoint}/columns/{_quote(column_id_or_name)}")
 
     def list_rows(
         self,
@@ -487,12 +1005,67 @@ class Coda:
             data['syncToken'] = sync_token
 
         return self.get(
-            f"/docs/{doc_id}/tables/{table_id_or_name}/rows",
+            _table_endpoint(doc_id, table_id_or_name) + "/rows",
             data=data,
             limit=limit,
             offset=offset,
         )
 
+    def iter_rows(
+        self,
+        doc_id: str,
+        table_id_or_name: str,
+        query: str = None,
+        use_column_names: bool = False,
+        offset: int = None,
+        sync_token: str = None,
+        prefetch: bool = False,
+        page_size: int = None,
+        stream: bool = False,
+    ) -> Iterator[Dict]:
+        """
+        Iterates over rows in a table, fetching one page at a time.
+
+        Takes the same parameters as `list_rows`, except `limit`.
+
+        Docs: https://coda.io/developers/apis/v1/#tag/Rows
+
+        :param doc_id:  ID of the doc. Example: "AbCDeFGH"
+
+        :param table_id_or_name: ID or name of the table.
+
+        :param query: filter returned rows, specified as `<column_id_or_name>:<value>`.
+
+        :param use_column_names: Use column names instead of column IDs in the returned output.
+
+        :param offset: An opaque token used to fetch the next page of results.
+
+        :param sync_token: An opaque token returned from a previous call.
+
+        :param prefetch: Request the next page while the current one is being consumed.
+
+        :param page_size: Number of rows to request per page, at most `MAX_GET_LIMIT`.
+
+        :param stream: Yield rows while each page is still downloading, see `iter_items`.
+        """
+        data = {"useColumnNames": use_column_names}
+        if query:
+            data["query"] = query
+
+        if sync_token:
+            data["syncToken"] = sync_token
+
+        if page_size:
+            data["limit"] = min(page_size, MAX_GET_LIMIT)
+
+        return self.iter_items(
+            _table_endpoint(doc_id, table_id_or_name) + "/rows",
+            data=data,
+            offset=offset,
+            prefetch=prefetch,
+            stream=stream,
+        )
+
     def upsert_row(self, doc_id: str, table_id_or_name: str, data: Dict) -> Dict:
         """
         Inserts rows into a table, optionally updating existing rows if key columns are provided.
@@ -517,7 +1090,7 @@ class Coda:
                 "keyColumns": ["c-bCdeFgh"]
             }
         """
-        return self.post(f"/docs/{doc_id}/tables/{table_id_or_name}/rows", data)
+        return self.post(_table_endpoint(doc_id, table_id_or_name) + "/rows", data)
 
     def get_row(self, doc_id: str, table_id_or_name: str, row_id_or_name: str) -> Dict:
         """
@@ -537,9 +1110,8 @@ class Coda:
             If there are multiple rows with the same value in the identifying column,
             an arbitrary one will be selected.
         """
-        return self.get(
-            f"/docs/{doc_id}/tables/{table_id_or_name}/rows/{row_id_or_name}"
-        )
+        endpoint = _table_endpoint(doc_id, table_id_or_name)
+        return self.get(f"{endpoint}/rows/{_quote(row_id_or_name)}")
 
     def update_row(
         self, doc_id: str, table_id_or_name: str, row_id_or_name: str, data: Dict
@@ -568,9 +1140,8 @@ class Coda:
 
         :param data: Example: {"row": {"cells": [{"column": "c-tuVwxYz", "value": "$12.34"}]}}
         """
-        return self.put(
-            f"/docs/{doc_id}/tables/{table_id_or_name}/rows/{row_id_or_name}", data
-        )
+        endpoint = _table_endpoint(doc_id, table_id_or_name)
+        return self.put(f"{endpoint}/rows/{_quote(row_id_or_name)}", data)
 
     def delete_row(self, doc_id, table_id_or_name: str, row_id_or_name: str) -> Dict:
         """
@@ -595,8 +1166,30 @@ class Coda:
             If there are multiple rows with the same value in the identifying column,
             an arbitrary one will be selected.
         """
+        endpoint = _table_endpoint(doc_id, table_id_or_name)
+        return self.delete(f"{endpoint}/rows/{_quote(row_id_or_name)}")
+
+    def delete_rows(self, doc_id: str, table_id_or_name: str, row_ids: List[str]) -> Dict:
+        """
+        Deletes the specified rows from the table in a single request.
+
+        This endpoint will always return a 202, so long as the table exists and
+        is accessible (and the request is structurally valid).
+        Row deletions are generally processed within several seconds.
+
+        Docs: https://coda.io/developers/apis/v1/#operation/deleteRows
+
+        :param doc_id:  ID of the doc. Example: "AbCDeFGH"
+
+        :param table_id_or_name: ID or name of the table.
+            Names are discouraged because they're easily prone to being changed by users.
+            If you're using a name, be sure to URI-encode it. Example: "grid-pqRst-U"
+
+        :param row_ids: IDs of the rows to delete.
+        """
         return self.delete(
-            f"/docs/{doc_id}/tables/{table_id_or_name}/rows/{row_id_or_name}"
+            _table_endpoint(doc_id, table_id_or_name) + "/rows",
+            data={"rowIds": row_ids},
         )
 
     def list_formulas(self, doc_id: str, offset: int = None, limit: int = None) -> Dict:
@@ -611,7 +1204,7 @@ class Coda:
 
         :param offset: An opaque token used to fetch the next page of results.
         """
-        return self.get(f"/docs/{doc_id}/formulas", offset=offset, limit=limit)
+        return self.get(f"/docs/{_quote(doc_id)}/formulas", offset=offset, limit=limit)
 
     def get_formula(self, doc_id: str, formula_id_or_name: str) -> Dict:
         """
@@ -625,7 +1218,7 @@ class Coda:
             Names are discouraged because they're easily prone to being changed by users.
             If you're using a name, be sure to URI-encode it. Example: "f-fgHijkLm".
         """
-        return self.get(f"/docs/{doc_id}/formulas/{formula_id_or_name}")
+        return self.get(f"/docs/{_quote(doc_id)}/formulas/{_quote(formula_id_or_name)}")
 
     def list_controls(self, doc_id: str, offset: int = None, limit: int = None) -> Dict:
         """
@@ -644,7 +1237,7 @@ class Coda:
 
         :return:
         """
-        return self.get(f"/docs/{doc_id}/controls", offset=offset, limit=limit)
+        return self.get(f"/docs/{_quote(doc_id)}/controls", offset=offset, limit=limit)
 
     def get_control(self, doc_id: str, control_id_or_name: str) -> Dict:
         """
@@ -657,7 +1250,7 @@ class Coda:
             Names are discouraged because they're easily prone to being changed by users.
             If you're using a name, be sure to URI-encode it. Example: "ctrl-cDefGhij".
         """
-        return self.get(f"/docs/{doc_id}/controls/{control_id_or_name}")
+        return self.get(f"/docs/{_quote(doc_id)}/controls/{_quote(control_id_or_name)}")
 
     def account(self) -> Dict:
         """
@@ -694,8 +1287,22 @@ class Coda:
             data={"url": url, "degradeGracefully": degrade_gracefully},
         )
 
+    def get_mutation_status(self, request_id: str) -> Dict:
+        """
+        Returns whether a mutation, like a row update, has been applied.
+
+        Write endpoints return a `requestId` while the change is processed asynchronously.
+        The status is never served from the GET cache, since it's meant to be polled.
+
+        Docs: https://coda.io/developers/apis/v1/#operation/getMutationStatus
+
+        :param request_id: ID of the request returned by a mutation.
+            Example: "abc-123-def-456"
+        """
+        return self._get_page(self.href + f"/mutationStatus/{_quote(request_id)}")
+
 
-@attr.s(hash=True)
+@attr.s(hash=True, slots=True)
 class CodaObject:
     id: str = attr.ib(repr=False)
     type: str = attr.ib(repr=False)
@@ -704,132 +1311,330 @@ class CodaObject:
     document: Document = attr.ib(repr=False)
 
     @classmethod
-    def from_json(cls, js: Dict, *, document: Document):
-        js = {inflection.underscore(k): v for k, v in js.items()}
+    def from_json(cls, js: Dict, *, document: Document, **kwargs):
+        """
+        Instantiates an object from its JSON representation returned by the API.
+
+        :param js: object as returned by the API.
+
+        :param document: `Document` the object belongs to.
+
+        :param kwargs: further attributes not part of `js`, like the `table` of a `Row`.
+
+        :return:
+        """
+        js = _convert_keys(js)
         for key in ["parent", "format"]:
             if key in js:
                 js.pop(key)
-        return cls(**js, document=document)
+        return cls(**js, **kwargs, document=document)
 
 
-@attr.s(hash=True)
+@attr.s(hash=True, repr=False, slots=True)
 class Document:
-    """Main class for interacting with coda.io API using `codaio` objects."""
+    """
+    Main class for interacting with coda.io API using `codaio` objects.
 
-    id: str = attr.ib(repr=False)
-    type: str = attr.ib(init=False, repr=False)
-    href: str = attr.ib(init=False, repr=False)
-    name: str = attr.ib(init=False)
-    owner: str = attr.ib(init=False)
-    created_at: dt.datetime = attr.ib(init=False, repr=False)
-    updated_at: dt.datetime = attr.ib(init=False, repr=False)
-    browser_link: str = attr.ib(init=False)
-    coda: Coda = attr.ib(repr=False)
+    Document metadata (name, owner, timestamps etc.) is fetched from the API
+    on first access rather than on instantiation.
+    """
+
+    id: str = attr.ib()
+    href: str = attr.ib(init=False)
+    coda: Coda = attr.ib()
+    _data: Dict = attr.ib(init=False, default=None, eq=False)
+    _async_coda: Coda = attr.ib(init=False, default=None, repr=False, eq=False)
+    _sections: List[Section] = attr.ib(init=False, default=None, repr=False, eq=False)
+    _tables: List[Table] = attr.ib(init=False, default=None, repr=False, eq=False)
 
     @classmethod
     def from_environment(cls, doc_id: str):
         """
         Instantiates a `Document` with the API key in the `CODA_API_KEY` environment variable.
 
+        Each call creates its own `Coda` client; to share one session between documents,
+        pass the same client: `Document(doc_id, coda=coda)`.
+
         :param doc_id: ID of the doc. Example: "AbCDeFGH"
 
         :return:
         """
         return cls(id=doc_id, coda=Coda.from_environment())
 
-    def __attrs_post_init__(self):
-        self.href = f"/docs/{self.id}"
-        data = self.coda.get(self.href + "/")
-        if not data:
-            raise err.DocumentNotFound(f"No document with id {self.id}")
-        self.name = data["name"]
-        self.owner = data["owner"]
-        self.created_at = parse(data["createdAt"])
-        self.updated_at = parse(data["updatedAt"])
-        self.type = data["type"]
-        self.browser_link = data["browserLink"]
-
-    def list_sections(self, offset: int = None, limit: int = None) -> List[Section]:
+    @classmethod
+    def from_json(cls, js: Dict, *, coda: Coda) -> Document:
         """
-        Returns a list of `Section` objects for each section in the document.
+        Instantiates a `Document` from doc metadata already returned by the API,
+        e.g. an item of `Coda.list_docs`, so its metadata isn't requested again.
 
-        :param limit: Maximum number of results to return in this query.
+        :param js: doc metadata as returned by the API.
 
-        :param offset: An opaque token used to fetch the next page of results.
+        :param coda: `Coda` client to use for further requests.
 
         :return:
         """
-        return [
-            Section.from_json(i, document=self)
-            for i in self.coda.list_sections(self.id, offset=offset, limit=limit)[
-                "items"
-            ]
+        document = cls(id=js["id"], coda=coda)
+        document._data = js
+        return document
+
+    def __attrs_post_init__(self):
+        self.href = f"/docs/{_quote(self.id)}"
+
+    def __repr__(self):
+        # Never triggers the metadata request: only metadata already loaded is shown.
+        if self._data is None:
+            return f"Document(id={self.id!r})"
+        return (
+            f"Document(id={self.id!r}, name={self._data.get('name')!r}, "
+            f"owner={self._data.get('owner')!r}, "
+            f"browser_link={self._data.get('browserLink')!r})"
+        )
+
+    @property
+    def async_coda(self):
+        """
+        `codaio.aio.AsyncCoda` client with the API key of `coda`, created on first use.
+
+        It sends the requests of the coroutine methods of `Table`, like `Table.aupdate_row`.
+        Requires `httpx` to be installed. Close it with `Document.aclose`.
+
+        :return:
+        """
+        if self._async_coda is None:
+            from codaio.aio import AsyncCoda
+
+            self._async_coda = AsyncCoda(
+                api_key=self.coda.api_key,
+                href=self.coda.href,
+                pool_maxsize=self.coda.pool_maxsize,
+            )
+        return self._async_coda
+
+    async def aclose(self):
+        """
+        Closes the connections of `async_coda`, if it was created.
+
+        :return:
+        """
+        if self._async_coda is not None:
+            await self._async_coda.aclose()
+            self._async_coda = None
+
+    def _metadata(self) -> Dict:
+        if self._data is None:
+            data = self.coda.get(self.href + "/")
+            if not data:
+                raise err.DocumentNotFound(f"No document with id {self.id}")
+            self._data = data
+        return self._data
+
+    @property
+    def type(self) -> str:
+        return self._metadata()["type"]
+
+    @property
+    def name(self) -> str:
+        return self._metadata()["name"]
+
+    @property
+    def owner(self) -> str:
+        return self._metadata()["owner"]
+
+    @property
+    def created_at(self) -> dt.datetime:
+        return _parse_datetime(self._metadata()["createdAt"])
+
+    @property
+    def updated_at(self) -> dt.datetime:
+        return _parse_datetime(self._metadata()["updatedAt"])
+
+    @property
+    def browser_link(self) -> str:
+        return self._metadata()["browserLink"]
+
+    def list_sections(self, offset: int = None, limit: int = None) -> List[Section]:
+        """
+        Returns a list of `Section` objects for each section in the document.
+
+        The full list is stored after the first call, use `refresh_sections()`
+        to fetch it again.
+
+        :param limit: Maximum number of results to return in this query.
+
+        :param offset: An opaque token used to fetch the next page of results.
+
+        :return:
+        """
+        if offset or limit:
+            return self._fetch_sections(offset=offset, limit=limit)
+        if self._sections is None:
+            self._sections = self._fetch_sections()
+        return self._sections
+
+    def refresh_sections(self) -> List[Section]:
+        """
+        Fetches the document's sections again, replacing the stored ones.
+
+        :return:
+        """
+        self._sections = None
+        return self.list_sections()
+
+    def _fetch_sections(self, offset: int = None, limit: int = None) -> List[Section]:
+        return [
+            Section.from_json(i, document=self)
+            for i in self.coda.list_sections(self.id, offset=offset, limit=limit)[
+                "items"
+            ]
         ]
 
-    def list_tables(self, offset: int = None, limit: int = None) -> List[Table]:
+    def list_tables(
+        self, offset: int = None, limit: int = None, prefetch_columns: bool = False
+    ) -> List[Table]:
         """
         Returns a list of `Table` objects for each table in the document.
 
+        The full list is stored after the first call, so the same `Table` objects,
+        and with them their stored columns, are returned until `refresh_tables()`.
+
         :param limit: Maximum number of results to return in this query.
 
         :param offset: An opaque token used to fetch the next page of results.
 
+        :param prefetch_columns: Also load the columns of the tables concurrently,
+            see `Document.prefetch_columns`.
+
         :return:
         """
+        if offset or limit:
+            tables = self._fetch_tables(offset=offset, limit=limit)
+        else:
+            if self._tables is None:
+                self._tables = self._fetch_tables()
+            tables = self._tables
+
+        if prefetch_columns:
+            self.prefetch_columns(tables)
+        return tables
 
+    def refresh_tables(self) -> List[Table]:
+        """
+        Fetches the document's tables again, replacing the stored ones.
+
+        :return:
+        """
+        self._tables = None
+        return self.list_tables()
+
+    def _fetch_tables(self, offset: int = None, limit: int = None) -> List[Table]:
         return [
             Table.from_json(i, document=self)
             for i in self.coda.list_tables(self.id, offset=offset, limit=limit)["items"]
         ]
 
-    def get_table(self, table_id_or_name: str) -> Table:
+    def prefetch_columns(
+        self, tables: List[Table] = None, max_workers: int = 8
+    ) -> List[Table]:
+        """
+        Loads the columns of several tables concurrently.
+
+        Tables store their columns after the first `Table.columns()` call,
+        so prefetching replaces one sequential request per table with concurrent ones.
+
+        :param tables: list of `Table` objects. Defaults to all tables in the document.
+
+        :param max_workers: Maximum number of concurrent requests.
+
+        :return:
+        """
+        if tables is None:
+            tables = self.list_tables()
+
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            list(executor.map(Table.columns, tables))
+        return tables
+
+    def load_all_tables(
+        self, tables: List[Table] = None, max_workers: int = 8
+    ) -> Dict[str, List[Row]]:
+        """
+        Loads the columns and rows of several tables concurrently.
+
+        Columns are stored on the tables like after `Table.columns()`;
+        only the first load of a table's columns should run concurrently with other calls.
+
+        :param tables: list of `Table` objects. Defaults to all tables in the document.
+
+        :param max_workers: Maximum number of concurrent requests.
+
+        :return: rows of every table, keyed by table ID
+        """
+        if tables is None:
+            tables = self.list_tables()
+
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            rows = [executor.submit(table.rows) for table in tables]
+            list(executor.map(Table.columns, tables))
+            return {table.id: future.result() for table, future in zip(tables, rows)}
+
+    def get_table(self, table_id_or_name: str, preload_columns: bool = False) -> Table:
         """
         Gets a Table object from table name or ID.
 
+        Columns are loaded on the first `Table.columns()` call unless `preload_columns` is set.
+
         :param table_id_or_name: ID or name of the table.
             Names are discouraged because they're easily prone to being changed by users.
             If you're using a name, be sure to URI-encode it. Example: "grid-pqRst-U"
 
+        :param preload_columns: Load the table's columns right away.
+
         :return:
         """
         table_data = self.coda.get_table(self.id, table_id_or_name)
         if table_data:
-            return Table.from_json(table_data, document=self)
+            table = Table.from_json(table_data, document=self)
+            if preload_columns:
+                table.columns()
+            return table
         raise err.TableNotFound(f"{table_id_or_name}")
 
 
-@attr.s(auto_attribs=True, hash=True)
+@attr.s(auto_attribs=True, hash=True, slots=True)
 class Folder(CodaObject):
     pass
 
 
-@attr.s(auto_attribs=True, hash=True)
+@attr.s(auto_attribs=True, hash=True, slots=True)
 class Section(CodaObject):
     name: str
     browser_link: str = attr.ib(repr=False)
     document: Document = attr.ib(repr=False)
 
 
-@attr.s(auto_attribs=True, hash=True)
+@attr.s(auto_attribs=True, hash=True, slots=True)
 class Table(CodaObject):
     name: str
     document: Document = attr.ib(repr=False)
     display_column: Dict = attr.ib(default=None, repr=False)
     browser_link: str = attr.ib(default=None, repr=False)
     row_count: int = attr.ib(default=None, repr=False)
-    sorts: List = attr.ib(default=[], repr=False)
+    sorts: List = attr.ib(factory=list, repr=False)
     layout: str = attr.ib(repr=False, default=None)
     table_type: str = attr.ib(default=None, repr=False)
-    created_at: dt.datetime = attr.ib(
-        repr=False, converter=lambda x: parse(x) if x else None, default=None
-    )
-    updated_at: dt.datetime = attr.ib(
-        repr=False, converter=lambda x: parse(x) if x else None, default=None
-    )
-    columns_storage: List[Column] = attr.ib(default=[], repr=False)
+    # Timestamps are parsed on access, like those of `Row`.
+    _created_at: str = attr.ib(repr=False, default=None)
+    _updated_at: str = attr.ib(repr=False, default=None)
+    columns_storage: List[Column] = attr.ib(factory=list, repr=False)
     filter: Dict = attr.ib(default=None, repr=False)
     parent_table: Table = attr.ib(default=None, repr=False)
     view_id: str = attr.ib(default=None, repr=False)
+    _columns_by_id: Dict[str, Column] = attr.ib(
+        init=False, factory=dict, repr=False, eq=False
+    )
+    _columns_by_name: Dict[str, List[Column]] = attr.ib(
+        init=False, factory=dict, repr=False, eq=False
+    )
 
     def __getitem__(self, item):
         """
@@ -849,12 +1654,22 @@ class Table(CodaObject):
             return self.get_row_by_id(item.id)
         raise ValueError("item type must be in [str, Row]")
 
+    @property
+    def created_at(self) -> dt.datetime:
+        return _parse_optional_datetime(self._created_at)
+
+    @property
+    def updated_at(self) -> dt.datetime:
+        return _parse_optional_datetime(self._updated_at)
+
     def columns(self, offset: int = None, limit: int = None) -> List[Column]:
         """
         Lists Table columns.
 
         Columns are stored in self.columns_storage for faster access
         as they tend to change less frequently than rows.
+        Only the full column list is stored: a page requested with `offset` or `limit`
+        is fetched and returned as is.
 
         :param limit: Maximum number of results to return in this query.
 
@@ -862,16 +1677,35 @@ class Table(CodaObject):
 
         :return:
         """
+        if offset or limit:
+            return self._fetch_columns(offset=offset, limit=limit)
+
         if not self.columns_storage:
-            self.columns_storage = [
-                Column.from_json({**i, "table": self}, document=self.document)
-                for i in self.document.coda.list_columns(
-                    self.document.id, self.id, offset=offset, limit=limit
-                )["items"]
-            ]
+            self.columns_storage = self._fetch_columns()
+        return self.columns_storage
+
+    def refresh_columns(self) -> List[Column]:
+        """
+        Fetches Table columns again, replacing the stored ones.
+
+        Use after the table schema was changed (e.g. columns added or renamed in Coda).
+
+        :return:
+        """
+        self.columns_storage = self._fetch_columns()
+        self._columns_by_id = {}
+        self._columns_by_name = {}
         return self.columns_storage
 
-    def rows(self, offset: int = None, limit: int = None) -> List[Row]:
+    def _fetch_columns(self, offset: int = None, limit: int = None) -> List[Column]:
+        return [
+            Column.from_json(i, table=self, document=self.document)
+            for i in self.document.coda.list_columns(
+                self.document.id, self.id, offset=offset, limit=limit
+            )["items"]
+        ]
+
+    def rows(self, offset: int = None, limit: int = None, query: str = None) -> List[Row]:
         """
         Returns list of Table rows.
 
@@ -879,18 +1713,94 @@ class Table(CodaObject):
 
         :param offset: An opaque token used to fetch the next page of results.
 
+        :param query: filter returned rows, specified as `<column_id_or_name>:<value>`.
+            Passed to the API as is, see `Coda.list_rows`.
+
         :return:
         """
         return [
-            Row.from_json({"table": self, **i}, document=self.document)
+            Row.from_json(i, table=self, document=self.document)
             for i in self.document.coda.list_rows(
-                self.document.id, self.id, offset=offset, limit=limit
+                self.document.id, self.id, query=query, offset=offset, limit=limit
             )["items"]
         ]
 
+    def iter_rows(
+        self,
+        offset: int = None,
+        prefetch: bool = False,
+        query: str = None,
+        page_size: int = None,
+        stream: bool = False,
+    ) -> Iterator[Row]:
+        """
+        Iterates over Table rows, fetching them page by page.
+
+        Use instead of `rows()` for large tables: only the current page is kept in memory
+        and the first rows are available as soon as the first page arrives.
+
+        :param offset: An opaque token used to fetch the next page of results.
+
+        :param prefetch: Request the next page of rows in a background thread
+            while the current one is being consumed.
+
+        :param query: filter returned rows, specified as `<column_id_or_name>:<value>`.
+            Passed to the API as is, see `Coda.list_rows`.
+
+        :param page_size: Number of rows to request per page.
+            Smaller pages make the first rows available sooner.
+
+        :param stream: Parse each page incrementally with `ijson` (if installed), so rows
+            are yielded while the page is still downloading. Can't be combined with `prefetch`.
+
+        :return:
+        """
+        for i in self.document.coda.iter_rows(
+            self.document.id,
+            self.id,
+            query=query,
+            offset=offset,
+            prefetch=prefetch,
+            page_size=page_size,
+            stream=stream,
+        ):
+            yield Row.from_json(i, table=self, document=self.document)
+
+    def iter_row_pages(
+        self, offset: int = None, query: str = None, page_size: int = None
+    ) -> Iterator[Tuple[List[Row], str]]:
+        """
+        Iterates over Table rows page by page, together with the token of the next page.
+
+        Store the token to resume later with `iter_rows(offset=token)`
+        or `iter_row_pages(offset=token)`, e.g. after a failed export.
+        The token is None for the last page.
+
+        :param offset: An opaque token used to fetch the next page of results.
+
+        :param query: filter returned rows, specified as `<column_id_or_name>:<value>`.
+
+        :param page_size: Number of rows to request per page.
+
+        :return:
+        """
+        data = {"useColumnNames": False}
+        if query:
+            data["query"] = query
+        if page_size:
+            data["limit"] = min(page_size, MAX_GET_LIMIT)
+
+        endpoint = _table_endpoint(self.document.id, self.id) + "/rows"
+        for page in self.document.coda.iter_pages(endpoint, data=data, offset=offset):
+            rows = [
+                Row.from_json(i, table=self, document=self.document)
+                for i in page.get("items", [])
+            ]
+            yield rows, page.get("nextPageToken")
+
     def get_row_by_id(self, row_id: str) -> Row:
         row_js = self.document.coda.get_row(self.document.id, self.id, row_id)
-        row = Row.from_json({**row_js, "table": self}, document=self.document)
+        row = Row.from_json(row_js, table=self, document=self.document)
         return row
 
     def get_column_by_id(self, column_id) -> Column:
@@ -901,9 +1811,11 @@ class Table(CodaObject):
 
         :return:
         """
+        if not self._columns_by_id:
+            self._columns_by_id = {column.id: column for column in self.columns()}
         try:
-            return next(filter(lambda x: x.id == column_id, self.columns()))
-        except StopIteration:
+            return self._columns_by_id[column_id]
+        except KeyError:
             raise err.ColumnNotFound(f"No column with id {column_id}")
 
     def get_column_by_name(self, column_name) -> Column:
@@ -915,7 +1827,12 @@ class Table(CodaObject):
 
         :return:
         """
-        res = list(filter(lambda x: x.name == column_name, self.columns()))
+        if not self._columns_by_name:
+            columns_by_name = {}
+            for column in self.columns():
+                columns_by_name.setdefault(column.name, []).append(column)
+            self._columns_by_name = columns_by_name
+        res = self._columns_by_name.get(column_name)
         if not res:
             raise err.ColumnNotFound(f"No column with name: {column_name}")
         if len(res) > 1:
@@ -936,15 +1853,7 @@ class Table(CodaObject):
 
         :return:
         """
-        r = self.document.coda.list_rows(
-            self.document.id, self.id, query=f'"{column_name}":{json.dumps(value)}'
-        )
-        if not r.get("items"):
-            return []
-        return [
-            Row.from_json({**i, "table": self}, document=self.document)
-            for i in r["items"]
-        ]
+        return self.rows(query=f'"{column_name}":{_dumps(value).decode()}')
 
     def find_row_by_column_id_and_value(self, column_id, value) -> List[Row]:
         """
@@ -956,15 +1865,57 @@ class Table(CodaObject):
 
         :return:
         """
-        r = self.document.coda.list_rows(
-            self.document.id, self.id, query=f"{column_id}:{json.dumps(value)}"
-        )
-        if not r.get("items"):
-            return []
-        return [
-            Row.from_json({**i, "table": self}, document=self.document)
-            for i in r["items"]
-        ]
+        return self.rows(query=f"{column_id}:{_dumps(value).decode()}")
+
+    def find_rows_bulk(
+        self, column: Union[str, Column], values: List[Any], max_workers: int = 8
+    ) -> Dict[Any, List[Row]]:
+        """
+        Finds rows for each of several values in a column.
+
+        A row matches a value when its raw value in the column is equal to it.
+        When the values are few compared to the table's `row_count`, one query per value
+        is sent concurrently and its results are matched the same way, since the API's
+        own matching is looser for formatted, number and date values.
+        Otherwise the table is listed once, which saves a request per value.
+
+        :param column: `Column` object or ID of the column.
+
+        :param values: Search values, must be hashable.
+
+        :param max_workers: Maximum number of concurrent queries.
+
+        :return: found rows for every value, an empty list if nothing matched
+        """
+        column_id = column.id if isinstance(column, Column) else column
+        for value in values:
+            try:
+                hash(value)
+            except TypeError:
+                raise TypeError(f"Search values must be hashable, got {value!r}") from None
+
+        if self.row_count is not None and len(values) > self.row_count * 0.1:
+            found = {value: [] for value in values}
+            for row in self.iter_rows(prefetch=True):
+                try:
+                    rows = found.get(row.values.get(column_id))
+                except TypeError:  # unhashable value, e.g. a list
+                    continue
+                if rows is not None:
+                    rows.append(row)
+            return found
+
+        # The `query` parameter of the API matches a single `<column>:<value>` pair and
+        # has no OR, so the values can't be batched into fewer queries.
+        def find(value):
+            return [
+                row
+                for row in self.find_row_by_column_id_and_value(column_id, value)
+                if row.values.get(column_id) == value
+            ]
+
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            return dict(zip(values, executor.map(find, values)))
 
     def upsert_row(
         self, cells: List[Cell], key_columns: List[Union[str, Column]] = None
@@ -994,17 +1945,44 @@ class Table(CodaObject):
         :param key_columns: list of `Column` objects, column IDs, URLs, or names
             specifying columns to be used as upsert keys.
         """
-        data = {
-            "rows": [
-                {
-                    "cells": [
-                        {"column": cell.column_id_or_name, "value": cell.value}
-                        for cell in row
-                    ]
-                }
-                for row in rows
-            ]
-        }
+        data = self._upsert_rows_data(rows, key_columns)
+        return self.document.coda.upsert_row(self.document.id, self.id, data)
+
+    def upsert_rows_in_chunks(
+        self,
+        rows: List[List[Cell]],
+        key_columns: List[Union[str, Column]] = None,
+        chunk_size: int = 1000,
+        max_workers: int = 8,
+    ) -> List[Dict]:
+        """
+        Upserts a large number of rows, sending up to `chunk_size` of them per request.
+
+        The requests are sent concurrently, so rows with the same key values should be
+        in the same chunk, otherwise each may be added as a new row.
+
+        :param rows: list of lists of `Cell` objects, one list for each row.
+
+        :param key_columns: list of `Column` objects, column IDs, URLs, or names
+            specifying columns to be used as upsert keys.
+
+        :param chunk_size: Maximum number of rows upserted per request.
+
+        :param max_workers: Maximum number of concurrent requests.
+
+        :return: API responses, one per request
+        """
+        chunks = [rows[i:i + chunk_size] for i in range(0, len(rows), chunk_size)]
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            return list(
+                executor.map(lambda chunk: self.upsert_rows(chunk, key_columns), chunks)
+            )
+
+    @staticmethod
+    def _upsert_rows_data(
+        rows: List[List[Cell]], key_columns: List[Union[str, Column]] = None
+    ) -> Dict:
+        data = {"rows": [{"cells": _cells_json(row)} for row in rows]}
 
         if key_columns:
             if not isinstance(key_columns, list):
@@ -1012,19 +1990,9 @@ class Table(CodaObject):
                     f"key_columns parameter '{key_columns}' is not a list."
                 )
 
-            data["keyColumns"] = []
+            data["keyColumns"] = [_key_column_id(column) for column in key_columns]
 
-            for key_column in key_columns:
-                if isinstance(key_column, Column):
-                    data["keyColumns"].append(key_column.id)
-                elif isinstance(key_column, str):
-                    data["keyColumns"].append(key_column)
-                else:
-                    raise err.ColumnNotFound(
-                        f"Invalid parameter: '{key_column}' in key_columns."
-                    )
-
-        return self.document.coda.upsert_row(self.document.id, self.id, data)
+        return data
 
     def update_row(self, row: Union[str, Row], cells: List[Cell]) -> Dict:
         """
@@ -1033,23 +2001,36 @@ class Table(CodaObject):
         :param row: a str ROW_ID or an instance of class Row
         :param cells: list of `Cell` objects.
         """
+        data = {"row": {"cells": _cells_json(cells)}}
+        return self.document.coda.update_row(
+            self.document.id, self.id, self._row_id(row), data
+        )
+
+    @staticmethod
+    def _row_id(row: Union[str, Row]) -> str:
         if isinstance(row, Row):
-            row_id = row.id
+            return row.id
         elif isinstance(row, str):
-            row_id = row
-        else:
-            raise TypeError("row must be str ROW_ID or an instance of Row")
-
-        data = {
-            "row": {
-                "cells": [
-                    {"column": cell.column_id_or_name, "value": cell.value}
-                    for cell in cells
-                ]
-            }
-        }
+            return row
+        raise TypeError("row must be str ROW_ID or an instance of Row")
+
+    def update_rows(
+        self, updates: List[Tuple[Union[str, Row], List[Cell]]], max_workers: int = 8
+    ) -> List[Dict]:
+        """
+        Updates several rows, each with values according to its list of cells.
 
-        return self.document.coda.update_row(self.document.id, self.id, row_id, data)
+        The API updates one row per request, so the requests are sent concurrently.
+
+        :param updates: list of (row, cells) pairs, where row is a str ROW_ID
+            or an instance of class Row and cells is a list of `Cell` objects.
+
+        :param max_workers: Maximum number of concurrent requests.
+
+        :return: API responses in the order of `updates`
+        """
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            return list(executor.map(lambda update: self.update_row(*update), updates))
 
     def delete_row_by_id(self, row_id: str):
         """
@@ -1068,16 +2049,203 @@ class Table(CodaObject):
 
         return self.delete_row_by_id(row.id)
 
-    def to_dict(self) -> List[Dict]:
+    def delete_rows(
+        self, rows: List[Union[str, Row]], chunk_size: int = 1000
+    ) -> List[Dict]:
+        """
+        Deletes several rows, sending up to `chunk_size` of them per request.
+
+        :param rows: list of str ROW_IDs or instances of class Row.
+
+        :param chunk_size: Maximum number of rows deleted per request.
+
+        :return: API responses, one per request
+        """
+        row_ids = [row.id if isinstance(row, Row) else row for row in rows]
+        return [
+            self.document.coda.delete_rows(
+                self.document.id, self.id, row_ids[i:i + chunk_size]
+            )
+            for i in range(0, len(row_ids), chunk_size)
+        ]
+
+    def to_dict(self, prefetch: bool = True) -> List[Dict]:
         """
         Returns entire table as list of dicts. Intended for use with pandas:
 
         pd.DataFrame(table.to_dict())
+
+        The columns are fetched together with the first page of rows, and with `prefetch`
+        each next page of rows is requested while the current one is being converted.
+
+        :param prefetch: Request the next page of rows in a background thread.
+
+        :return:
+        """
+        rows = self.iter_rows(prefetch=prefetch)
+        first_rows = []
+        if not self.columns_storage:
+            with ThreadPoolExecutor(max_workers=1) as executor:
+                columns = executor.submit(self.columns)
+                first_rows = list(islice(rows, 1))
+                columns.result()
+        return [row.to_dict() for row in chain(first_rows, rows)]
+
+    # Coroutine versions of the methods above, sending their requests through
+    # `Document.async_coda`, so that many of them can run concurrently:
+    #
+    #     await asyncio.gather(*(table.aupdate_row(row, cells) for row, cells in updates))
+
+    async def arows(
+        self, offset: int = None, limit: int = None, query: str = None
+    ) -> List[Row]:
         """
-        return [row.to_dict() for row in self.rows()]
+        Coroutine version of `Table.rows`.
+
+        :param limit: Maximum number of results to return in this query.
 
+        :param offset: An opaque token used to fetch the next page of results.
+
+        :param query: filter returned rows, specified as `<column_id_or_name>:<value>`.
+
+        :return:
+        """
+        res = await self.document.async_coda.list_rows(
+            self.document.id, self.id, query=query, offset=offset, limit=limit
+        )
+        return [
+            Row.from_json(i, table=self, document=self.document)
+            for i in res["items"]
+        ]
+
+    async def aiter_rows(
+        self,
+        offset: int = None,
+        prefetch: bool = False,
+        query: str = None,
+        page_size: int = None,
+    ) -> AsyncIterator[Row]:
+        """
+        Coroutine version of `Table.iter_rows`, an async generator of the table's rows.
+
+        With `prefetch` the next page is requested while the current one is consumed,
+        so consuming rows and waiting for the API overlap.
+
+        :param offset: An opaque token used to fetch the next page of results.
+
+        :param prefetch: Request the next page while the current one is being consumed.
+
+        :param query: filter returned rows, specified as `<column_id_or_name>:<value>`.
+
+        :param page_size: Number of rows to request per page.
+
+        :return:
+        """
+        async for i in self.document.async_coda.iter_rows(
+            self.document.id,
+            self.id,
+            query=query,
+            offset=offset,
+            prefetch=prefetch,
+            page_size=page_size,
+        ):
+            yield Row.from_json(i, table=self, document=self.document)
+
+    async def aget_row_by_id(self, row_id: str) -> Row:
+        """
+        Coroutine version of `Table.get_row_by_id`.
+
+        :param row_id: ID of the row.
+
+        :return:
+        """
+        coda = self.document.async_coda
+        row_js = await coda.get_row(self.document.id, self.id, row_id)
+        return Row.from_json(row_js, table=self, document=self.document)
+
+    async def afind_row_by_column_name_and_value(
+        self, column_name: str, value: Any
+    ) -> List[Row]:
+        """
+        Coroutine version of `Table.find_row_by_column_name_and_value`.
+
+        :param column_name:  Name of the column.
+
+        :param value: Search value.
+
+        :return:
+        """
+        return await self.arows(query=f'"{column_name}":{_dumps(value).decode()}')
+
+    async def afind_row_by_column_id_and_value(self, column_id, value) -> List[Row]:
+        """
+        Coroutine version of `Table.find_row_by_column_id_and_value`.
+
+        :param column_id: ID of the column.
+
+        :param value: Search value.
+
+        :return:
+        """
+        return await self.arows(query=f"{column_id}:{_dumps(value).decode()}")
 
-@attr.s(auto_attribs=True, hash=True)
+    async def aupsert_row(
+        self, cells: List[Cell], key_columns: List[Union[str, Column]] = None
+    ) -> Dict:
+        """
+        Coroutine version of `Table.upsert_row`.
+
+        :param cells: list of `Cell` objects.
+        :param key_columns: list of `Column` objects, column IDs, URLs, or names
+            specifying columns to be used as upsert keys.
+        """
+        return await self.aupsert_rows([cells], key_columns)
+
+    async def aupsert_rows(
+        self, rows: List[List[Cell]], key_columns: List[Union[str, Column]] = None
+    ) -> Dict:
+        """
+        Coroutine version of `Table.upsert_rows`.
+
+        :param rows: list of lists of `Cell` objects, one list for each row.
+        :param key_columns: list of `Column` objects, column IDs, URLs, or names
+            specifying columns to be used as upsert keys.
+        """
+        data = self._upsert_rows_data(rows, key_columns)
+        return await self.document.async_coda.upsert_row(self.document.id, self.id, data)
+
+    async def aupdate_row(self, row: Union[str, Row], cells: List[Cell]) -> Dict:
+        """
+        Coroutine version of `Table.update_row`.
+
+        :param row: a str ROW_ID or an instance of class Row
+        :param cells: list of `Cell` objects.
+        """
+        data = {"row": {"cells": _cells_json(cells)}}
+        return await self.document.async_coda.update_row(
+            self.document.id, self.id, self._row_id(row), data
+        )
+
+    async def adelete_row_by_id(self, row_id: str) -> Dict:
+        """
+        Coroutine version of `Table.delete_row_by_id`.
+
+        :param row_id: ID of the row to delete.
+        """
+        return await self.document.async_coda.delete_row(
+            self.document.id, self.id, row_id
+        )
+
+    async def adelete_row(self, row: Row) -> Dict:
+        """
+        Coroutine version of `Table.delete_row`.
+
+        :param row: a `Row` object to delete.
+        """
+        return await self.adelete_row_by_id(row.id)
+
+
+@attr.s(auto_attribs=True, hash=True, slots=True)
 class Column(CodaObject):
     name: str
     table: Table = attr.ib(repr=False)
@@ -1087,19 +2255,28 @@ class Column(CodaObject):
     default_value: str = attr.ib(default=None, repr=False)
 
 
-@attr.s(auto_attribs=True, hash=True)
+@attr.s(auto_attribs=True, hash=True, slots=True)
 class Row(CodaObject):
     name: str
-    created_at: dt.datetime = attr.ib(converter=lambda x: parse(x), repr=False)
+    # Timestamps are kept as returned by the API and only parsed when accessed,
+    # since most rows are read for their values alone.
+    _created_at: str = attr.ib(repr=False)
     index: int
-    updated_at: dt.datetime = attr.ib(
-        converter=lambda x: parse(x) if x else None, repr=False
-    )
-    values: Tuple[Tuple] = attr.ib(
-        converter=lambda x: tuple([(k, v) for k, v in x.items()]), repr=False
-    )
+    _updated_at: str = attr.ib(repr=False)
+    values: Dict[str, Any] = attr.ib(converter=_values_to_dict, repr=False, hash=False)
     table: Table = attr.ib(repr=False)
     browser_link: str = attr.ib(default=None, repr=False)
+    _cells_by_id: Dict[str, Cell] = attr.ib(
+        init=False, default=None, repr=False, eq=False
+    )
+
+    @property
+    def created_at(self) -> dt.datetime:
+        return _parse_datetime(self._created_at)
+
+    @property
+    def updated_at(self) -> dt.datetime:
+        return _parse_optional_datetime(self._updated_at)
 
     def columns(self):
         return self.table.columns()
@@ -1108,14 +2285,21 @@ class Row(CodaObject):
         new_data = self.table.document.coda.get_row(
             self.table.document.id, self.table.id, self.id
         )
-        self.values = tuple([(k, v) for k, v in new_data["values"].items()])
+        self.values = _values_to_dict(new_data["values"])
+        self._cells_by_id = None
         return self
 
     def cells(self) -> List[Cell]:
-        return [
-            Cell(column=self.table.get_column_by_id(i[0]), value_storage=i[1], row=self)
-            for i in self.values
-        ]
+        return list(self.iter_cells())
+
+    def iter_cells(self) -> Iterator[Cell]:
+        """
+        Lazily yields the row's cells, so that consumers stopping early don't build all of them.
+
+        :return:
+        """
+        for column_id in self.values:
+            yield self.get_cell_by_column_id(column_id)
 
     def delete(self):
         """
@@ -1126,50 +2310,122 @@ class Row(CodaObject):
         return self.table.delete_row(self)
 
     def get_cell_by_column_id(self, column_id: str) -> Cell:
+        # Cells are kept until the next refresh(), so repeated lookups return the same Cell.
+        if self._cells_by_id is None:
+            self._cells_by_id = {}
+        elif column_id in self._cells_by_id:
+            return self._cells_by_id[column_id]
+
         try:
-            return next(filter(lambda x: x.column.id == column_id, self.cells()))
-        except StopIteration:
+            value = self.values[column_id]
+        except KeyError:
             raise KeyError("Column not found")
+        cell = self._cells_by_id[column_id] = Cell(
+            column=column_id, value_storage=value, row=self
+        )
+        return cell
 
     def __getitem__(self, item) -> Cell:
         if isinstance(item, Column):
             return self.get_cell_by_column_id(item.id)
         elif isinstance(item, str):
-            try:
-                return self.get_cell_by_column_id(item)
-            except KeyError:
-                pass
-            column = self.table.get_column_by_name(item)
-            found_by_name = self.get_cell_by_column_id(column.id)
-            if found_by_name:
-                return found_by_name
+            # Column IDs are looked up in the row's values, anything else is a column name.
+            if item not in self.values:
+                item = self.table.get_column_by_name(item).id
+            return self.get_cell_by_column_id(item)
 
         raise KeyError(f"Invalid column_id: {item}")
 
+    def get(self, item: Union[str, Column], default: Any = None) -> Union[Cell, Any]:
+        """
+        Returns the cell for a `Column`, column ID or name, or `default` if the row has none.
+
+        :param item: `Column` object, column ID or column name.
+
+        :param default: returned when the row has no such cell.
+
+        :return:
+        """
+        try:
+            return self[item]
+        except (KeyError, err.ColumnNotFound):
+            return default
+
     def __setitem__(self, item, value) -> Cell:
         cell = self.__getitem__(item)
-        data = {"row": {"cells": [{"column": cell.column.id, "value": value}]}}
+        data = {"row": {"cells": [{"column": cell.column_id_or_name, "value": value}]}}
         self.document.coda.update_row(
             self.document.id, self.table.id, self.id, data=data
         )
         cell.value_storage = value
+        self.values[cell.column_id_or_name] = value
         return cell
 
+    def wait_for_mutation(self, request_id: str, timeout: float = 7.0) -> Dict:
+        """
+        Waits until a mutation of the row, like a cell update, has been applied by the API.
+
+        The status is checked right away, then polled with exponential backoff.
+
+        :param request_id: `requestId` returned by the mutation.
+
+        :param timeout: seconds to wait at most.
+
+        :raises err.MutationPending: if the mutation isn't applied within `timeout`.
+
+        :return: the mutation status.
+        """
+        coda = self.document.coda
+        status = coda.get_mutation_status(request_id)
+        waited, delay = 0.0, 0.2
+        while not status.get("completed"):
+            if waited >= timeout:
+                raise err.MutationPending(
+                    f"Mutation {request_id} not applied after {timeout} seconds"
+                )
+            delay = min(delay, timeout - waited)
+            time.sleep(delay)
+            waited += delay
+            delay = min(delay * 2, 2.0)
+            status = coda.get_mutation_status(request_id)
+        return status
+
     def to_dict(self) -> Dict:
         """
         Returns a row as a dictionary.
 
+        Values are read directly, without building `Cell` objects.
+        Columns the row has no value for are left out.
+
         :return:
         """
-        return {column.name: self[column].value for column in self.columns()}
+        values = self.values
+        return {
+            column.name: values[column.id]
+            for column in self.columns()
+            if column.id in values
+        }
 
 
-@attr.s(auto_attribs=True, hash=True, repr=False)
+@attr.s(auto_attribs=True, hash=True, repr=False, slots=True)
 class Cell:
-    column: Union[str, Column]
+    # A column ID given together with a row is resolved to its Column on first access,
+    # so reading cell values doesn't require the table's columns.
+    # Cells compare and hash by column ID, so resolving the column doesn't change them.
+    _column: Union[str, Column] = attr.ib(eq=_column_id_or_name)
     value_storage: Any
     row: Row = attr.ib(default=None)
 
+    @property
+    def column(self) -> Union[str, Column]:
+        if isinstance(self._column, str) and self.row is not None:
+            self._column = self.row.table.get_column_by_id(self._column)
+        return self._column
+
+    @column.setter
+    def column(self, column: Union[str, Column]):
+        self._column = column
+
     @property
     def name(self):
         return self.column.name
@@ -1193,21 +2449,35 @@ class Cell:
 
     @property
     def column_id_or_name(self):
-        if isinstance(self.column, Column):
-            return self.column.id
-        elif isinstance(self.column, str):
-            return self.column
+        return _column_id_or_name(self._column)
 
     @value.setter
     def value(self, value):
-        data = {"row": {"cells": [{"column": self.column.id, "value": value}]}}
-        self.document.coda.update_row(
+        self.set_value(value)
+
+    def set_value(self, value: Any, wait: bool = False, timeout: float = 7.0) -> Dict:
+        """
+        Updates the cell's value in Coda, like assigning `cell.value`.
+
+        Row updates are applied asynchronously by the API, so by default this returns
+        as soon as the update is accepted. Pass `wait=True` to block until it is applied,
+        see `Row.wait_for_mutation`.
+
+        :param value: new value of the cell.
+
+        :param wait: wait until the API has applied the update.
+
+        :param timeout: seconds to wait at most, raising `err.MutationPending` after.
+
+        :return: API response, including the `requestId` of the update.
+        """
+        data = {"row": {"cells": [{"column": self.column_id_or_name, "value": value}]}}
+        res = self.document.coda.update_row(
             self.document.id, self.table.id, self.row.id, data=data
         )
         self.value_storage = value
+        self.row.values[self.column_id_or_name] = value
 
-        new_value = None
-        while new_value != value:
-            self.row.refresh()
-            new_value = self.row.get_cell_by_column_id(self.column.id).value
-            time.sleep(0.3)
+        if wait and res.get("requestId"):
+            self.row.wait_for_mutation(res["requestId"], timeout=timeout)
+        return res
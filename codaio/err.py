@@ -36,3 +36,7 @@ class AmbiguousName(CodaError):
 
 class InvalidCell(CodaError):
     pass
+
+
+class MutationPending(CodaError):
+    pass
@@ -1,10 +1,24 @@
 import pytest
+from functools import lru_cache
 from pathlib import Path
 import responses
 import json
 from codaio import Coda, Document
 
 BASE_URL = "https://coda.io/apis/v1"
+DATA_DIRECTORY = Path(__file__).parent.resolve() / "data"
+
+
+@lru_cache(maxsize=None)
+def load_json(filename):
+    """
+    load a json file from the /test/data/ folder.
+
+    Files are read once per session: mocks serialize their json when registered,
+    so the returned object is never modified.
+    """
+    with open(DATA_DIRECTORY / filename) as json_file:
+        return json.load(json_file)
 
 
 @pytest.fixture(scope="session")
@@ -40,11 +54,7 @@ def mock_json_response(mocked_responses):
     def _mock_json_response_from_file(
         url, filename, method="GET", status=200, **kwargs
     ):
-        test_directory = Path(__file__).parent.resolve()
-        relative_data_directory = "data"
-        json_path = Path(test_directory / relative_data_directory / filename)
-        with open(json_path) as json_file:
-            json_content = json.load(json_file)
+        json_content = load_json(filename)
 
         method_map = {
             "ANY": responses.UNSET,
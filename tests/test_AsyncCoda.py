@@ -0,0 +1,240 @@
+import asyncio
+import json
+
+import pytest
+
+from codaio import Cell, err
+from tests.conftest import BASE_URL, load_json
+
+httpx = pytest.importorskip("httpx")
+from codaio.aio import AsyncCoda  # noqa: E402
+from codaio.coda import RetryTransport  # noqa: E402
+
+
+@pytest.fixture
+def mock_transport():
+    """
+    register mocked json responses on an `httpx.MockTransport`.
+
+    Responses are registered as (method, url, filename, status, headers);
+    a url registered several times returns its responses in order.
+    Like `responses`, a url registered without a query string matches any query.
+    Handled requests are recorded in `requests`.
+    """
+    routes = {}
+    requests = []
+
+    def add(method, url, filename, status=200, headers=None):
+        json_content = load_json(filename)
+        routes.setdefault((method, url), []).append((status, json_content, headers))
+
+    def handler(request):
+        requests.append(request)
+        url = str(request.url)
+        if (request.method, url) not in routes:
+            url = url.split("?")[0]
+        queue = routes[(request.method, url)]
+        status, json_content, headers = queue.pop(0) if len(queue) > 1 else queue[0]
+        return httpx.Response(status, json=json_content, headers=headers)
+
+    add.transport = httpx.MockTransport(handler)
+    add.requests = requests
+    return add
+
+
+@pytest.fixture
+def async_coda(mock_transport):
+    coda = AsyncCoda("ANY_KEY")
+    coda.session = httpx.AsyncClient(
+        headers=coda.headers, transport=mock_transport.transport
+    )
+    return coda
+
+
+class TestAsyncCoda:
+    def test_session_headers(self):
+        coda = AsyncCoda("ANY_KEY")
+        assert coda.session.headers["Authorization"] == "Bearer ANY_KEY"
+        assert coda.session.headers["Content-Type"] == "application/json"
+
+    def test_sync_close_rejected(self):
+        coda = AsyncCoda("ANY_KEY")
+        with pytest.raises(TypeError, match="aclose"):
+            coda.close()
+        with pytest.raises(TypeError, match="async with"):
+            with coda:
+                pass
+        asyncio.run(coda.aclose())
+
+    def test_cache_ttl_rejected(self):
+        with pytest.raises(ValueError, match="cache_ttl"):
+            AsyncCoda("ANY_KEY", cache_ttl=60)
+
+    def test_sync_helpers_rejected(self, async_coda):
+        with pytest.raises(TypeError, match="cache"):
+            async_coda.invalidate()
+        with pytest.raises(TypeError, match="await"):
+            async_coda._get_all_pages("/docs", {})
+
+        async def collect():
+            return [doc async for doc in async_coda.iter_items("/docs", stream=True)]
+
+        with pytest.raises(ValueError, match="stream"):
+            asyncio.run(collect())
+
+    def test_semaphore_follows_loop(self, async_coda, mock_transport):
+        mock_transport("GET", BASE_URL + "/docs/doc_id", "get_doc.json")
+        asyncio.run(async_coda.get_doc("doc_id"))
+        semaphore = async_coda._semaphore
+        asyncio.run(async_coda.get_doc("doc_id"))
+        assert async_coda._semaphore is not semaphore
+
+    def test_get(self, async_coda, mock_transport):
+        mock_transport("GET", BASE_URL + "/docs/doc_id", "get_doc.json")
+        data = asyncio.run(async_coda.get_doc("doc_id"))
+        assert data["id"] == "doc_id"
+
+    def test_get_paginated(self, async_coda, mock_transport):
+        mock_transport("GET", BASE_URL + "/docs", "get_docs_first_page.json")
+        mock_transport("GET", BASE_URL + "/docs?pageToken=token", "get_docs.json")
+        docs = asyncio.run(async_coda.list_docs())
+        assert [doc["id"] for doc in docs["items"]] == ["first_doc_id", "doc_id"]
+
+    def test_iter_items_prefetch(self, async_coda, mock_transport):
+        mock_transport("GET", BASE_URL + "/docs", "get_docs_first_page.json")
+        mock_transport("GET", BASE_URL + "/docs?pageToken=token", "get_docs.json")
+
+        async def collect():
+            return [doc["id"] async for doc in async_coda.iter_items("/docs", prefetch=True)]
+
+        assert asyncio.run(collect()) == ["first_doc_id", "doc_id"]
+
+    def test_get_many(self, async_coda, mock_transport):
+        mock_transport("GET", BASE_URL + "/docs/doc_id", "get_doc.json")
+        mock_transport("GET", BASE_URL + "/docs", "get_docs.json")
+        doc, docs = asyncio.run(async_coda.get_many(["/docs/doc_id", "/docs"]))
+        assert doc["id"] == "doc_id"
+        assert docs["items"]
+
+    def test_post_json_body(self, async_coda, mock_transport):
+        mock_transport("POST", BASE_URL + "/docs", "get_doc.json")
+        asyncio.run(async_coda.create_doc("Test_Document"))
+
+        request = mock_transport.requests[0]
+        assert request.headers["Content-Type"] == "application/json"
+        assert json.loads(request.content) == {"title": "Test_Document"}
+
+    def test_retry_rate_limited(self, async_coda, mock_transport):
+        url = BASE_URL + "/docs/doc_id"
+        mock_transport("GET", url, "unauthorized.json", 429, {"Retry-After": "0"})
+        mock_transport("GET", url, "get_doc.json")
+
+        assert asyncio.run(async_coda.get_doc("doc_id"))["id"] == "doc_id"
+        assert len(mock_transport.requests) == 2
+
+    def test_retry_post_rate_limited(self, async_coda, mock_transport):
+        url = BASE_URL + "/docs"
+        mock_transport("POST", url, "unauthorized.json", 429, {"Retry-After": "0"})
+        mock_transport("POST", url, "get_doc.json")
+
+        assert asyncio.run(async_coda.create_doc("Test_Document"))["id"] == "doc_id"
+        assert len(mock_transport.requests) == 2
+
+    def test_post_server_error_not_retried(self, async_coda, mock_transport):
+        url = BASE_URL + "/docs"
+        mock_transport("POST", url, "unauthorized.json", 503)
+        mock_transport("POST", url, "get_doc.json")
+
+        with pytest.raises(err.CodaError):
+            asyncio.run(async_coda.create_doc("Test_Document"))
+        assert len(mock_transport.requests) == 1
+
+    def test_sync_retry_transport(self, mock_transport):
+        url = BASE_URL + "/docs/doc_id"
+        mock_transport("GET", url, "unauthorized.json", 429, {"Retry-After": "0"})
+        mock_transport("GET", url, "get_doc.json")
+
+        with httpx.Client(transport=RetryTransport(mock_transport.transport)) as client:
+            assert client.get(url).json()["id"] == "doc_id"
+        assert len(mock_transport.requests) == 2
+
+    def test_raise(self, async_coda, mock_transport):
+        mock_transport("DELETE", BASE_URL + "/docs/doc_id", "not_found.json", status=404)
+        with pytest.raises(err.NotFound):
+            asyncio.run(async_coda.delete_doc("doc_id"))
+
+
+class TestAsyncTable:
+    @pytest.fixture
+    def async_table(self, main_table, async_coda):
+        main_table.document._async_coda = async_coda
+        return main_table
+
+    def test_async_coda_created_lazily(self, main_document):
+        coda = main_document.async_coda
+        assert isinstance(coda, AsyncCoda)
+        assert coda.api_key == main_document.coda.api_key
+        assert main_document.async_coda is coda
+        asyncio.run(main_document.aclose())
+        assert main_document._async_coda is None
+
+    def test_aupdate_row(self, async_table, mock_transport):
+        row_url = BASE_URL + "/docs/doc_id/tables/table_id/rows/"
+        for row_id in ["row_a", "row_b"]:
+            mock_transport("PUT", row_url + row_id, "put_row.json", status=202)
+
+        async def update():
+            return await asyncio.gather(
+                async_table.aupdate_row("row_a", [Cell("column_id", "value_a")]),
+                async_table.aupdate_row("row_b", [Cell("column_id", "value_b")]),
+            )
+
+        assert len(asyncio.run(update())) == 2
+        bodies = {
+            str(request.url): json.loads(request.content)
+            for request in mock_transport.requests
+        }
+        assert bodies[row_url + "row_b"] == {
+            "row": {"cells": [{"column": "column_id", "value": "value_b"}]}
+        }
+
+    def test_afind_row_by_column_id_and_value(self, async_table, mock_transport):
+        mock_transport(
+            "GET",
+            BASE_URL + "/docs/doc_id/tables/table_id/rows",
+            "get_row_by_query.json",
+        )
+        rows = asyncio.run(
+            async_table.afind_row_by_column_id_and_value("column_id", "value-Alpha")
+        )
+        assert [row.id for row in rows] == ["row_id"]
+        assert rows[0].table is async_table
+        assert mock_transport.requests[0].url.params["query"] == 'column_id:"value-Alpha"'
+
+    def test_aiter_rows(self, async_table, mock_transport):
+        url = BASE_URL + "/docs/doc_id/tables/table_id/rows"
+        mock_transport("GET", url, "get_rows.json")
+
+        async def collect():
+            return [row async for row in async_table.aiter_rows(prefetch=True)]
+
+        rows = asyncio.run(collect())
+        assert [row.id for row in rows] == ["index_id"]
+        assert rows[0]["column_id"].value == "value-1-Alpha"
+
+    def test_aget_row_by_id(self, async_table, mock_transport):
+        row_url = BASE_URL + "/docs/doc_id/tables/table_id/rows/"
+        mock_transport("GET", row_url + "index_id", "get_row.json")
+        mock_transport("GET", row_url + "no_such_id", "row_not_found.json", status=404)
+
+        async def fetch():
+            return await asyncio.gather(
+                async_table.aget_row_by_id("index_id"),
+                async_table.aget_row_by_id("index_id"),
+            )
+
+        rows = asyncio.run(fetch())
+        assert [row.id for row in rows] == ["index_id", "index_id"]
+        assert rows[0].table is async_table
+        with pytest.raises(err.NotFound):
+            asyncio.run(async_table.aget_row_by_id("no_such_id"))
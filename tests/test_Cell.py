@@ -1,6 +1,6 @@
 import pytest
 
-from codaio import Cell
+from codaio import Cell, err
 from tests.conftest import BASE_URL
 
 BASE_TABLE_URL = BASE_URL + "/docs/doc_id/tables/table_id/"
@@ -8,20 +8,104 @@ BASE_TABLE_URL = BASE_URL + "/docs/doc_id/tables/table_id/"
 
 class TestCell:
     @pytest.mark.parametrize("new_value", ["completely_new_value"])
-    def test_set_value(self, mock_json_responses, main_table, new_value):
+    def test_set_value(
+        self, mock_json_responses, main_table, new_value, mocked_responses, monkeypatch
+    ):
 
         responses = [
             ("rows?useColumnNames=False", "get_rows.json", {}),
             ("rows?useColumnNames=False", "get_updated_rows.json", {}),
             ("columns", "get_columns.json", {}),
             ("rows/index_id", "put_row.json", {"method": "PUT", "status": 202}),
-            ("rows/index_id", "get_updated_row.json", {}),
         ]
         mock_json_responses(responses, BASE_TABLE_URL)
+        sleeps = []
+        monkeypatch.setattr("codaio.coda.time.sleep", sleeps.append)
 
-        cell_a = main_table.rows()[0].cells()[0]
+        row = main_table.rows()[0]
+        cell_a = row.cells()[0]
         assert isinstance(cell_a, Cell)
         cell_a.value = new_value
         assert cell_a.value == new_value
+        assert row.to_dict()["Alpha"] == new_value
+        assert not sleeps
+        assert not any("/mutationStatus/" in c.request.url for c in mocked_responses.calls)
         fetched_again_cell = main_table.rows()[0].cells()[0]
         assert fetched_again_cell.value == new_value
+
+    def test_set_value_wait(
+        self, mock_json_responses, mock_json_response, main_table, monkeypatch
+    ):
+        responses = [
+            ("rows?useColumnNames=False", "get_rows.json", {}),
+            ("rows/index_id", "put_row.json", {"method": "PUT", "status": 202}),
+        ]
+        mock_json_responses(responses, BASE_TABLE_URL)
+        mock_json_response(
+            BASE_URL + "/mutationStatus/request_id", "get_mutation_status.json"
+        )
+        sleeps = []
+        monkeypatch.setattr("codaio.coda.time.sleep", sleeps.append)
+
+        cell_a = main_table.rows()[0].cells()[0]
+        res = cell_a.set_value("new_value", wait=True)
+        assert res["requestId"] == "request_id"
+        assert cell_a.value == "new_value"
+        assert not sleeps
+
+    def test_wait_for_mutation_pending(
+        self, mock_json_responses, mock_json_response, main_table, monkeypatch, mocked_responses
+    ):
+        mock_json_responses(
+            [("rows?useColumnNames=False", "get_rows.json", {})], BASE_TABLE_URL
+        )
+        mock_json_response(
+            BASE_URL + "/mutationStatus/request_id", "get_mutation_status_pending.json"
+        )
+
+        def status_checks():
+            return sum(
+                "/mutationStatus/" in call.request.url for call in mocked_responses.calls
+            )
+
+        # Every sleep is recorded with the number of status checks made before it.
+        sleeps = []
+        monkeypatch.setattr(
+            "codaio.coda.time.sleep", lambda delay: sleeps.append((delay, status_checks()))
+        )
+
+        row = main_table.rows()[0]
+        with pytest.raises(err.MutationPending):
+            row.wait_for_mutation("request_id")
+        assert sleeps == [(0.2, 1), (0.4, 2), (0.8, 3), (1.6, 4), (2.0, 5), (2.0, 6)]
+        assert status_checks() == 7
+
+    def test_column_resolved_lazily(self, mock_json_responses, main_table, mocked_responses):
+        responses = [
+            ("rows?useColumnNames=False", "get_rows.json", {}),
+            ("columns", "get_columns.json", {}),
+        ]
+        mock_json_responses(responses, BASE_TABLE_URL)
+
+        cells = main_table.rows()[0].cells()
+        assert [cell.value for cell in cells]
+        assert not any("/columns" in call.request.url for call in mocked_responses.calls)
+
+        assert cells[0].column == main_table.get_column_by_id("column_id")
+
+    def test_eq_ignores_column_resolution(self, mock_json_responses, main_table):
+        responses = [
+            ("rows?useColumnNames=False", "get_rows.json", {}),
+            ("columns", "get_columns.json", {}),
+        ]
+        mock_json_responses(responses, BASE_TABLE_URL)
+
+        row = main_table.rows()[0]
+        touched = Cell("column_id", "value", row=row)
+        untouched = Cell("column_id", "value", row=row)
+        assert touched.column.id == "column_id"
+        assert touched == untouched
+
+        column = main_table.get_column_by_id("column_id")
+        assert Cell(column, "value") == Cell("column_id", "value")
+        assert hash(Cell(column, "value")) == hash(Cell("column_id", "value"))
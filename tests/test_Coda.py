@@ -1,34 +1,80 @@
+import datetime as dt
+import json
+from pathlib import Path
+
+import inflection
 import pytest
+import responses
 
+import codaio.coda
 from codaio import Coda, err
+from codaio.coda import _convert_keys, _parse_datetime
 from tests.conftest import BASE_URL
 
 BASE_DOC_URL = BASE_URL + "/docs"
+DATA_DIRECTORY = Path(__file__).parent.resolve() / "data"
 
 
 class TestCoda:
     def test_init(self, coda):
         assert isinstance(coda, Coda)
 
-    def test_raise_GET(self, coda, mock_unauthorized_response):
-        mock_unauthorized_response("GET")
-        with pytest.raises(err.CodaError):
-            coda.get("/")
+    def test_slots(self, coda):
+        assert not hasattr(coda, "__dict__")
 
-    def test_raise_POST(self, coda, mock_unauthorized_response):
-        mock_unauthorized_response("POST")
-        with pytest.raises(err.CodaError):
-            coda.post("/", {})
+    def test_session_headers(self, coda):
+        assert coda.session.headers["Authorization"] == f"Bearer {coda.api_key}"
 
-    def test_raise_PUT(self, coda, mock_unauthorized_response):
-        mock_unauthorized_response("PUT")
-        with pytest.raises(err.CodaError):
-            coda.put("/", {})
+    def test_session_accepts_compression(self, coda):
+        assert "gzip" in coda.session.headers["Accept-Encoding"]
+
+    def test_session_retries(self, coda):
+        retry = coda.session.get_adapter(coda.href).max_retries
+        assert 429 in retry.status_forcelist
+        assert {"PUT", "DELETE"} <= set(retry.allowed_methods)
+        assert "POST" not in retry.allowed_methods
+        assert retry.is_retry("PUT", 503)
+        assert retry.is_retry("POST", 429)
+        assert not retry.is_retry("POST", 503)
+        assert retry.respect_retry_after_header
+        assert not retry.raise_on_status
+
+    def test_pool_maxsize(self):
+        coda = Coda("ANY_KEY", pool_maxsize=100)
+        for url in ["https://coda.io", "http://localhost"]:
+            assert coda.session.get_adapter(url)._pool_maxsize == 100
+
+    def test_httpx_session(self, coda, monkeypatch):
+        httpx = pytest.importorskip("httpx")
+        monkeypatch.setattr("codaio.coda.requests", httpx)
+        with coda._make_session() as session:
+            assert isinstance(session, httpx.Client)
+            assert session.headers["Authorization"] == f"Bearer {coda.api_key}"
 
-    def test_raise_DELETE(self, coda, mock_unauthorized_response):
-        mock_unauthorized_response("DELETE")
+    def test_context_manager(self, mocked_responses, mock_json_response):
+        mock_json_response(BASE_URL + "/docs", "get_docs.json")
+        with Coda("ANY_KEY") as coda:
+            assert coda.list_docs()["items"]
+
+    @pytest.mark.parametrize(
+        "method, args",
+        [("GET", ("/",)), ("POST", ("/", {})), ("PUT", ("/", {})), ("DELETE", ("/",))],
+    )
+    def test_raise(self, coda, mock_unauthorized_response, method, args):
+        mock_unauthorized_response(method)
         with pytest.raises(err.CodaError):
-            coda.delete("/")
+            getattr(coda, method.lower())(*args)
+
+    def test_no_content(self, coda, mocked_responses):
+        mocked_responses.add(responses.DELETE, BASE_DOC_URL + "/doc_id", status=204)
+        assert coda.delete_doc("doc_id") == {"status": 204}
+
+    def test_raise_non_json_error(self, coda, mocked_responses):
+        mocked_responses.add(
+            responses.GET, BASE_DOC_URL + "/doc_id", body="Bad Gateway", status=502
+        )
+        with pytest.raises(err.CodaError, match="Message: Bad Gateway"):
+            coda.get_doc("doc_id")
 
     def test_list_documents(self, coda, mock_json_response):
         url = BASE_DOC_URL
@@ -39,6 +85,91 @@ class TestCoda:
         docs = coda.list_docs()
         assert docs
 
+    def test_list_documents_paginated(self, coda, mock_json_response):
+        url = BASE_DOC_URL
+        mock_json_response(url, "get_docs_first_page.json")
+        mock_json_response(url, "get_docs.json")
+
+        docs = coda.list_docs()
+        assert [doc["id"] for doc in docs["items"]] == ["first_doc_id", "doc_id"]
+        assert "nextPageLink" not in docs
+
+    def test_list_documents_three_pages(self, coda, mocked_responses, mock_json_response):
+        url = BASE_DOC_URL
+        mock_json_response(url, "get_docs_first_page.json")
+        mock_json_response(url, "get_docs_first_page.json")
+        mock_json_response(url, "get_docs.json")
+
+        docs = coda.list_docs()
+        assert [doc["id"] for doc in docs["items"]] == [
+            "first_doc_id",
+            "first_doc_id",
+            "doc_id",
+        ]
+        assert [call.request.url for call in mocked_responses.calls][1:] == [
+            url + "?pageToken=token"
+        ] * 2
+
+    def test_pages_decoded_once(self, coda, mock_json_response, monkeypatch):
+        url = BASE_DOC_URL
+        mock_json_response(url, "get_docs_first_page.json")
+        mock_json_response(url, "get_docs.json")
+
+        decoded = []
+        loads = codaio.coda._loads
+        monkeypatch.setattr(
+            "codaio.coda._loads", lambda content: decoded.append(content) or loads(content)
+        )
+        coda.list_docs()
+        assert len(decoded) == 2
+
+    def test_get_page(self, coda, mocked_responses, mock_json_response):
+        mock_json_response(BASE_DOC_URL, "get_docs_first_page.json")
+        mock_json_response(BASE_DOC_URL, "get_docs.json")
+
+        page = coda.get_page("/docs")
+        assert [doc["id"] for doc in page["items"]] == ["first_doc_id"]
+        assert page["nextPageToken"] == "token"
+
+        page = coda.get_page("/docs", offset=page["nextPageToken"])
+        assert [doc["id"] for doc in page["items"]] == ["doc_id"]
+        assert mocked_responses.calls[-1].request.url == BASE_DOC_URL + "?pageToken=token"
+        assert len(mocked_responses.calls) == 2
+
+    def test_iter_items(self, coda, mock_json_response):
+        url = BASE_DOC_URL
+        mock_json_response(url, "get_docs_first_page.json")
+        mock_json_response(url, "get_docs.json")
+
+        items = coda.iter_items("/docs")
+        assert next(items)["id"] == "first_doc_id"
+        assert [doc["id"] for doc in items] == ["doc_id"]
+
+    def test_iter_items_prefetch(self, coda, mock_json_response):
+        url = BASE_DOC_URL
+        mock_json_response(url, "get_docs_first_page.json")
+        mock_json_response(url, "get_docs.json")
+
+        items = coda.iter_items("/docs", prefetch=True)
+        assert [doc["id"] for doc in items] == ["first_doc_id", "doc_id"]
+
+    def test_iter_items_stream(self, coda, mock_json_response):
+        pytest.importorskip("ijson")
+        url = BASE_DOC_URL
+        mock_json_response(url, "get_docs_first_page.json")
+        mock_json_response(url, "get_docs.json")
+
+        streamed = list(coda.iter_items("/docs", stream=True))
+        assert [doc["id"] for doc in streamed] == ["first_doc_id", "doc_id"]
+        assert streamed[0]["name"] == "First Test Document"
+
+    def test_get_many(self, coda, mock_json_response):
+        mock_json_response(BASE_DOC_URL + "/doc_id", "get_doc.json")
+        mock_json_response(BASE_URL + "/docs", "get_docs.json")
+        doc, docs = coda.get_many(["/docs/doc_id", "/docs"])
+        assert doc["id"] == "doc_id"
+        assert docs["items"]
+
     def test_create_doc(self, coda, mock_json_response):
         url = BASE_DOC_URL
         json_file = "get_doc.json"
@@ -48,6 +179,65 @@ class TestCoda:
         doc_id = response["id"]
         assert doc_id
 
+    def test_post_json_body(self, coda, mocked_responses, mock_json_response):
+        mock_json_response(BASE_DOC_URL, "get_doc.json", method="POST")
+        coda.create_doc("Test_Document")
+
+        request = mocked_responses.calls[0].request
+        assert request.headers["Content-Type"] == "application/json"
+        assert json.loads(request.body) == {"title": "Test_Document"}
+
+    def test_cache_ttl(self, mocked_responses, mock_json_response):
+        mock_json_response(BASE_DOC_URL + "/doc_id", "get_doc.json")
+        mock_json_response(BASE_DOC_URL, "get_doc.json", method="POST")
+        coda = Coda("ANY_KEY", cache_ttl=60)
+
+        assert coda.get_doc("doc_id") == coda.get_doc("doc_id")
+        assert len(mocked_responses.calls) == 1
+
+        coda.create_doc("Test_Document")
+        coda.get_doc("doc_id")
+        assert len(mocked_responses.calls) == 3
+
+    def test_cache_ttl_list_params(self, mocked_responses, mock_json_response):
+        mock_json_response(BASE_DOC_URL, "get_docs.json")
+        coda = Coda("ANY_KEY", cache_ttl=60)
+
+        assert coda.get("/docs", {"ids": ["a", "b"]}) == coda.get("/docs", {"ids": ["a", "b"]})
+        coda.get("/docs", {"ids": ["a"]})
+        assert len(mocked_responses.calls) == 2
+
+    def test_mutation_invalidates_its_doc(self, mocked_responses, mock_json_response):
+        for doc_id in ["doc_a", "doc_b"]:
+            mock_json_response(BASE_DOC_URL + f"/{doc_id}", "get_doc.json")
+        mock_json_response(BASE_DOC_URL, "get_docs.json")
+        mock_json_response(
+            BASE_DOC_URL + "/doc_a/tables/table_id/rows", "empty.json", method="POST"
+        )
+        coda = Coda("ANY_KEY", cache_ttl=60)
+        coda.get_doc("doc_a")
+        coda.get_doc("doc_b")
+        coda.list_docs()
+
+        coda.upsert_row("doc_a", "table_id", {"rows": []})
+        coda.get_doc("doc_a")
+        coda.get_doc("doc_b")
+        coda.list_docs()
+        urls = [call.request.url.split("?")[0] for call in mocked_responses.calls[4:]]
+        assert urls == [BASE_DOC_URL + "/doc_a", BASE_DOC_URL]
+
+    def test_invalidate(self, mocked_responses, mock_json_response):
+        mock_json_response(BASE_DOC_URL + "/doc_id", "get_doc.json")
+        mock_json_response(BASE_DOC_URL, "get_docs.json")
+        coda = Coda("ANY_KEY", cache_ttl=60)
+        coda.get_doc("doc_id")
+        coda.list_docs()
+
+        coda.invalidate("/docs/doc_id")
+        coda.get_doc("doc_id")
+        coda.list_docs()
+        assert len(mocked_responses.calls) == 3
+
     def test_get_doc(self, coda, mock_json_response):
         doc_id = "doc_id"
         url = BASE_DOC_URL + "/doc_id"
@@ -72,6 +262,14 @@ class TestCoda:
         with pytest.raises(err.CodaError):
             coda.get_doc(doc_id)
 
+    def test_delete_rows(self, coda, mocked_responses, mock_json_response):
+        url = BASE_DOC_URL + "/doc_id/tables/table_id/rows"
+        mock_json_response(url, "empty.json", method="DELETE", status=202)
+
+        coda.delete_rows("doc_id", "table_id", ["row_a", "row_b"])
+        request = mocked_responses.calls[0].request
+        assert json.loads(request.body) == {"rowIds": ["row_a", "row_b"]}
+
     def test_get_rows(self, coda, mock_json_response):
         doc_id = 'doc_id'
         table_id_or_name = 'table_id'
@@ -89,3 +287,39 @@ class TestCoda:
             table_id_or_name=table_id_or_name,
             sync_token=sync_token,
         )
+
+    @pytest.mark.parametrize("table_name", ["Tasks / Done?", "Tasks%20%2F%20Done%3F"])
+    def test_get_table_by_name_quoted(self, coda, mocked_responses, table_name):
+        url = BASE_DOC_URL + "/doc_id/tables/Tasks%20%2F%20Done%3F"
+        mocked_responses.add(
+            responses.GET, url, json={"id": "table_id"}, match_querystring=True
+        )
+
+        assert coda.get_table("doc_id", table_name)["id"] == "table_id"
+        assert mocked_responses.calls[0].request.url == url
+
+    @pytest.mark.parametrize(
+        "value",
+        [
+            "2020-01-01T00:00:00.000Z",
+            "2020-01-01T00:00:00+00:00",
+            "2020-01-01 00:00:00 UTC",
+        ],
+    )
+    def test_parse_datetime(self, value):
+        assert _parse_datetime(value) == dt.datetime(2020, 1, 1, tzinfo=dt.timezone.utc)
+
+    def test_convert_keys(self):
+        assert _convert_keys({"browserLink": 1, "someNewKey": 2}) == {
+            "browser_link": 1,
+            "some_new_key": 2,
+        }
+
+    def test_convert_keys_fixtures(self):
+        """Every object in the API fixtures converts like `inflection.underscore`."""
+        for path in DATA_DIRECTORY.glob("*.json"):
+            items = json.loads(path.read_text()).get("items", [])
+            for item in items:
+                assert list(_convert_keys(item)) == [
+                    inflection.underscore(key) for key in item
+                ]
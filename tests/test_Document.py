@@ -0,0 +1,113 @@
+import pytest
+
+from codaio import Document, Row, err
+from tests.conftest import BASE_URL
+
+
+class TestDocument:
+    def test_metadata_is_lazy(self, coda, mocked_responses, mock_json_response):
+        document = Document("doc_id", coda=coda)
+        assert not mocked_responses.calls
+
+        mock_json_response(BASE_URL + "/docs/doc_id/", "get_doc.json")
+        assert document.name == "Test_Document"
+        assert document.owner == "foobar@example.com"
+        assert document.browser_link == "https://coda.io/d/_ddoc_id"
+        assert len(mocked_responses.calls) == 1
+
+    def test_repr_makes_no_request(self, coda, mocked_responses, mock_json_response):
+        document = Document("doc_id", coda=coda)
+        assert repr(document) == "Document(id='doc_id')"
+        assert not mocked_responses.calls
+
+        mock_json_response(BASE_URL + "/docs/doc_id/", "get_doc.json")
+        document.name
+        assert repr(document) == (
+            "Document(id='doc_id', name='Test_Document', owner='foobar@example.com', "
+            "browser_link='https://coda.io/d/_ddoc_id')"
+        )
+
+    def test_from_environment_own_client(self, monkeypatch):
+        monkeypatch.setenv("CODA_API_KEY", "ENV_KEY")
+        doc_a = Document.from_environment("doc_a")
+        doc_b = Document.from_environment("doc_b")
+        assert doc_a.coda.api_key == "ENV_KEY"
+        doc_a.coda.close()
+        assert doc_b.coda is not doc_a.coda
+        assert doc_b.coda.api_key == "ENV_KEY"
+
+    def test_raise_no_api_key(self, monkeypatch):
+        monkeypatch.delenv("CODA_API_KEY", raising=False)
+        with pytest.raises(err.NoApiKey):
+            Document.from_environment("doc_id")
+
+    def test_from_json(self, coda, mocked_responses, mock_json_response):
+        mock_json_response(BASE_URL + "/docs", "get_docs.json")
+        documents = [
+            Document.from_json(js, coda=coda) for js in coda.list_docs()["items"]
+        ]
+        assert documents[0].id == "doc_id"
+        assert documents[0].name == "Test Document"
+        assert len(mocked_responses.calls) == 1
+
+    def test_not_found(self, coda, mock_json_response):
+        mock_json_response(BASE_URL + "/docs/no_such_id/", "not_found.json", status=404)
+        document = Document("no_such_id", coda=coda)
+        with pytest.raises(err.NotFound):
+            document.name
+
+    def test_prefetch_columns(self, main_document, mock_json_response):
+        mock_json_response(BASE_URL + "/docs/doc_id/tables", "get_tables.json")
+        mock_json_response(
+            BASE_URL + "/docs/doc_id/tables/table_id/columns", "get_columns.json"
+        )
+
+        tables = main_document.prefetch_columns()
+        assert [table.id for table in tables] == ["table_id"]
+        assert tables[0].columns_storage
+
+    def test_load_all_tables(self, main_document, mock_json_response):
+        table_url = BASE_URL + "/docs/doc_id/tables/table_id"
+        mock_json_response(BASE_URL + "/docs/doc_id/tables", "get_tables.json")
+        mock_json_response(table_url + "/columns", "get_columns.json")
+        mock_json_response(table_url + "/rows?useColumnNames=False", "get_rows.json")
+
+        rows = main_document.load_all_tables()
+        assert list(rows) == ["table_id"]
+        assert all(isinstance(row, Row) for row in rows["table_id"])
+        assert rows["table_id"][0].table.columns_storage
+
+    def test_list_tables_stored(self, main_document, mocked_responses, mock_json_response):
+        mock_json_response(BASE_URL + "/docs/doc_id/tables", "get_tables.json")
+
+        tables = main_document.list_tables()
+        assert main_document.list_tables() is tables
+        calls = len(mocked_responses.calls)
+
+        assert main_document.refresh_tables() == tables
+        assert main_document.list_tables() is not tables
+        assert len(mocked_responses.calls) == calls + 1
+
+    def test_list_tables_prefetch_columns(self, main_document, mock_json_response):
+        mock_json_response(BASE_URL + "/docs/doc_id/tables", "get_tables.json")
+        mock_json_response(
+            BASE_URL + "/docs/doc_id/tables/table_id/columns", "get_columns.json"
+        )
+
+        tables = main_document.list_tables(prefetch_columns=True)
+        assert tables[0].columns_storage
+
+    def test_get_table_preload_columns(
+        self, main_document, mocked_responses, mock_json_response
+    ):
+        table_url = BASE_URL + "/docs/doc_id/tables/table_id"
+        mock_json_response(table_url, "get_table.json")
+        mock_json_response(table_url, "get_table.json")
+        mock_json_response(table_url + "/columns", "get_columns.json")
+
+        assert not main_document.get_table("table_id").columns_storage
+        calls = len(mocked_responses.calls)
+
+        table = main_document.get_table("table_id", preload_columns=True)
+        assert table.columns_storage
+        assert len(mocked_responses.calls) == calls + 2
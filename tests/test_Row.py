@@ -1,3 +1,6 @@
+import datetime as dt
+
+import attr
 import pytest
 
 from codaio import Cell, Column, Row
@@ -25,6 +28,27 @@ class TestRow:
         fetched_cell = row_a.get_cell_by_column_id(cell_a.column.id)
         assert isinstance(fetched_cell, Cell)
 
+    def test_iter_cells(self, main_table):
+        row_a: Row = main_table.rows()[0]
+        cells = row_a.iter_cells()
+        assert isinstance(next(cells), Cell)
+        assert [cell.value for cell in row_a.iter_cells()] == [
+            cell.value for cell in row_a.cells()
+        ]
+
+    def test_get_cell_by_unknown_column_id(self, main_table):
+        row_a: Row = main_table.rows()[0]
+        with pytest.raises(KeyError):
+            row_a.get_cell_by_column_id("unknown_column_id")
+
+    def test_cells_are_reused(self, main_table):
+        row_a: Row = main_table.rows()[0]
+        cell_a = row_a.cells()[0]
+        assert row_a.get_cell_by_column_id(cell_a.column.id) is cell_a
+
+        row_a.refresh()
+        assert row_a.get_cell_by_column_id(cell_a.column.id) is not cell_a
+
     def test_row_getitem(self, main_table, mock_json_responses):
 
         row_a: Row = main_table.rows()[0]
@@ -37,6 +61,55 @@ class TestRow:
         assert res_cell.column == column_a
         assert res_cell.row == row_a
 
+    def test_timestamps(self, main_table):
+        row_a: Row = main_table.rows()[0]
+        expected = dt.datetime(2020, 1, 1, tzinfo=dt.timezone.utc)
+        assert row_a.created_at == expected
+        assert row_a.updated_at == expected
+
+    def test_timestamps_parsed_on_access(self, main_table, monkeypatch):
+        parsed = []
+        monkeypatch.setattr("codaio.coda._parse_datetime", parsed.append)
+        row_a: Row = main_table.rows()[0]
+        assert not parsed
+        row_a.created_at
+        assert parsed == ["2020-01-01T00:00:00.000Z"]
+
     def test_refresh(self, main_table, mock_json_responses):
         row_a: Row = main_table.rows()[0]
         assert row_a.refresh()
+
+    def test_refresh_updates_cells(self, main_table, mock_json_response):
+        row_a: Row = main_table.rows()[0]
+        assert row_a.get_cell_by_column_id("column_id").value == "value-1-Alpha"
+
+        mock_json_response(
+            BASE_URL + "/docs/doc_id/tables/table_id/rows/index_id",
+            "get_updated_row.json",
+        )
+        row_a.refresh()
+        row_a.refresh()
+        assert row_a.get_cell_by_column_id("column_id").value == "completely_new_value"
+
+    def test_to_dict_builds_no_cells(self, main_table):
+        row_a: Row = main_table.rows()[0]
+        assert row_a.to_dict()["Alpha"] == "value-1-Alpha"
+        assert row_a._cells_by_id is None
+
+    def test_row_get(self, main_table):
+        row_a: Row = main_table.rows()[0]
+        assert row_a.get("column_id") is row_a["column_id"]
+        assert row_a.get("Alpha") is row_a["column_id"]
+        assert row_a.get("No such column") is None
+        assert row_a.get("Delta", "missing") == "missing"
+
+    def test_getitem_by_name_builds_one_cell(self, main_table):
+        row_a: Row = main_table.rows()[0]
+        assert row_a["Beta"].value == "value-1-Beta"
+        assert list(row_a._cells_by_id) == ["column_id-1"]
+
+    def test_values_dict(self, main_table):
+        row_a: Row = main_table.rows()[0]
+        assert row_a.values["column_id"] == "value-1-Alpha"
+        pairs = tuple(row_a.values.items())
+        assert attr.evolve(row_a, values=pairs).values == row_a.values
@@ -1,3 +1,7 @@
+import datetime as dt
+import json
+
+import attr
 import pytest
 
 from codaio import Cell, Column, Row, err
@@ -36,6 +40,92 @@ class TestTable:
         assert main_table.columns()
         assert isinstance(main_table.columns()[0], Column)
 
+    def test_iter_rows(self, main_table):
+        rows = list(main_table.iter_rows())
+        assert rows
+        assert all(isinstance(row, Row) for row in rows)
+
+    def test_iter_rows_stream(self, main_table, monkeypatch):
+        pytest.importorskip("ijson")
+        parsed = []
+        monkeypatch.setattr("codaio.coda._loads", parsed.append)
+        rows = list(main_table.iter_rows(stream=True))
+        assert [row.id for row in rows] == ["index_id"]
+        assert rows[0]["column_id"].value == "value-1-Alpha"
+        assert not parsed
+
+    def test_iter_row_pages(self, main_table):
+        pages = list(main_table.iter_row_pages())
+        assert [([row.id for row in rows], token) for rows, token in pages] == [
+            (["index_id"], None)
+        ]
+
+    def test_iter_rows_page_size(self, main_table, mock_json_response, mocked_responses):
+        mock_json_response(
+            BASE_URL + "/docs/doc_id/tables/table_id/rows?useColumnNames=False&limit=200",
+            "get_rows.json",
+        )
+        assert list(main_table.iter_rows(page_size=500))
+        assert mocked_responses.calls[-1].request.url.endswith("&limit=200")
+
+    def test_requests_use_client_session(self, main_table, mocked_responses):
+        main_table.rows()
+        main_table.columns()
+        requests = [call.request for call in mocked_responses.calls]
+        assert requests
+        for request in requests:
+            assert request.headers["Authorization"] == "Bearer ANY_KEY"
+
+    def test_rows_query(self, main_table):
+        rows = main_table.rows(query='column_id:"value-Alpha"')
+        assert rows == main_table.find_row_by_column_id_and_value(
+            "column_id", "value-Alpha"
+        )
+        assert all(isinstance(row, Row) for row in rows)
+
+    def test_to_dict(self, main_table):
+        assert main_table.to_dict() == [
+            {
+                "Alpha": "value-1-Alpha",
+                "Beta": "value-1-Beta",
+                "Omega": "value-1-Omega",
+                "Gamma": "value-1-Gamma",
+            }
+        ]
+        assert main_table.columns_storage
+
+    def test_find_rows_bulk_by_listing(self, main_table):
+        found = main_table.find_rows_bulk("column_id", ["value-1-Alpha", "value-Beta"])
+        assert [row.id for row in found["value-1-Alpha"]] == ["index_id"]
+        assert found["value-Beta"] == []
+
+    def test_find_rows_bulk_by_queries(self, main_table):
+        main_table.row_count = None
+        found = main_table.find_rows_bulk("column_id", ["value-Alpha"])
+        assert [row.id for row in found["value-Alpha"]] == ["row_id"]
+
+    @pytest.mark.parametrize("row_count", [None, 1], ids=["queries", "listing"])
+    def test_find_rows_bulk_same_matches(self, main_table, mock_json_response, row_count):
+        rows_url = BASE_URL + "/docs/doc_id/tables/table_id/rows?useColumnNames=False"
+        mock_json_response(
+            rows_url + "&query=column_id%3A%22value-1-Alpha%22", "get_rows.json"
+        )
+        # The API matches loosely: this row's value is "value-Alpha".
+        mock_json_response(
+            rows_url + "&query=column_id%3A%22value-Beta%22", "get_row_by_query.json"
+        )
+        main_table.row_count = row_count
+
+        found = main_table.find_rows_bulk("column_id", ["value-1-Alpha", "value-Beta"])
+        assert {value: [row.id for row in rows] for value, rows in found.items()} == {
+            "value-1-Alpha": ["index_id"],
+            "value-Beta": [],
+        }
+
+    def test_find_rows_bulk_unhashable(self, main_table):
+        with pytest.raises(TypeError, match="hashable"):
+            main_table.find_rows_bulk("column_id", [["value-1-Alpha"]])
+
     def test_get_column_by_id(self, main_table):
         columns = main_table.columns()
         for col in columns:
@@ -43,6 +133,38 @@ class TestTable:
         with pytest.raises(err.CodaError):
             main_table.get_column_by_id("no_such_id")
 
+    def test_refresh_columns(self, main_table, mocked_responses):
+        columns = main_table.columns()
+        main_table.get_column_by_name(columns[0].name)
+        calls = len(mocked_responses.calls)
+
+        assert main_table.refresh_columns() == columns
+        assert main_table.columns() == columns
+        assert main_table.get_column_by_id(columns[0].id) == columns[0]
+        assert len(mocked_responses.calls) == calls + 1
+
+    def test_cell_columns_share_index(self, main_table, mocked_responses):
+        cells = [cell for row in main_table.rows() for cell in row.cells()]
+        columns = [cell.column for cell in cells]
+
+        assert all(isinstance(column, Column) for column in columns)
+        assert columns[0] is main_table.columns()[0]
+        requests = [call.request.url for call in mocked_responses.calls]
+        assert sum(url.endswith("/columns") for url in requests) == 1
+
+    def test_get_column_by_name(self, main_table):
+        columns = main_table.columns()
+        for col in columns:
+            assert main_table.get_column_by_name(col.name) == col
+        with pytest.raises(err.ColumnNotFound):
+            main_table.get_column_by_name("No such column")
+
+    def test_get_column_by_ambiguous_name(self, main_table):
+        column = main_table.columns()[0]
+        main_table.columns_storage.append(attr.evolve(column, id="other_column_id"))
+        with pytest.raises(err.AmbiguousName):
+            main_table.get_column_by_name(column.name)
+
     def test_get_row_by_id(self, main_table):
         rows = main_table.rows()
         for row in rows:
@@ -52,8 +174,9 @@ class TestTable:
             main_table.get_row_by_id("no_such_id")
 
     def test_table_getitem(self, main_table):
-        assert main_table[main_table.rows()[0].id] == main_table.rows()[0]
-        assert main_table[main_table.rows()[0]] == main_table.rows()[0]
+        row = main_table.rows()[0]
+        assert main_table[row.id] == row
+        assert main_table[row] == row
 
     def test_upsert_row(self, main_table):
         columns = main_table.columns()
@@ -69,18 +192,19 @@ class TestTable:
         assert row[cell_1.column.id].value == cell_1.value
         assert row[cell_2.column.id].value == cell_2.value
 
-    def test_upsert_rows_by_column_id(self, main_table):
-        existing_rows = main_table.rows()
-
-        for row in existing_rows:
-            main_table.delete_row(row)
+    def test_upsert_rows_by_column_id(self, main_table, mock_json_response):
+        mock_json_response(
+            BASE_URL + "/docs/doc_id/tables/table_id/rows",
+            "empty.json",
+            method="DELETE",
+            status=202,
+        )
+        main_table.delete_rows(main_table.rows())
 
+        columns = main_table.columns()
         result = main_table.upsert_rows(
             [
-                [
-                    Cell(column.id, f"value-{str(row)}-{column.name}")
-                    for column in main_table.columns()
-                ]
+                [Cell(column.id, f"value-{row}-{column.name}") for column in columns]
                 for row in range(1, 6)
             ]
         )
@@ -91,13 +215,104 @@ class TestTable:
         assert len(saved_rows) == 5
         assert all([isinstance(row, Row) for row in saved_rows])
 
+    def test_upsert_rows_body(self, main_table, mocked_responses):
+        column = main_table.columns()[0]
+        main_table.upsert_rows(
+            [[Cell(column, "value_a"), Cell("Beta", 1)], [Cell(column, "value_b")]]
+        )
+
+        request = next(
+            call.request
+            for call in mocked_responses.calls
+            if call.request.method == "POST"
+        )
+        assert json.loads(request.body) == {
+            "rows": [
+                {
+                    "cells": [
+                        {"column": column.id, "value": "value_a"},
+                        {"column": "Beta", "value": 1},
+                    ]
+                },
+                {"cells": [{"column": column.id, "value": "value_b"}]},
+            ]
+        }
+
+    def test_upsert_rows_key_columns(self, main_table, mocked_responses):
+        column = main_table.columns()[0]
+        main_table.upsert_rows([[Cell(column, "value_a")]], [column, "Beta"])
+
+        request = next(
+            call.request
+            for call in mocked_responses.calls
+            if call.request.method == "POST"
+        )
+        assert json.loads(request.body)["keyColumns"] == [column.id, "Beta"]
+
+        with pytest.raises(err.ColumnNotFound):
+            main_table.upsert_rows([[Cell(column, "value_a")]], [column, 1])
+
+    def test_upsert_rows_in_chunks(self, main_table, mocked_responses):
+        rows = [[Cell("column_id", f"value-{i}")] for i in range(5)]
+        results = main_table.upsert_rows_in_chunks(rows, ["column_id"], chunk_size=2)
+        assert len(results) == 3
+
+        bodies = [
+            json.loads(call.request.body)
+            for call in mocked_responses.calls
+            if call.request.method == "POST"
+        ]
+        assert sorted(len(body["rows"]) for body in bodies) == [1, 2, 2]
+        assert all(body["keyColumns"] == ["column_id"] for body in bodies)
+
+    def test_update_rows(self, main_table, mock_json_response, mocked_responses):
+        row_url = BASE_URL + "/docs/doc_id/tables/table_id/rows/"
+        for row_id in ["row_a", "row_b"]:
+            mock_json_response(
+                row_url + row_id, "put_row.json", method="PUT", status=202
+            )
+
+        results = main_table.update_rows(
+            [
+                ("row_a", [Cell("column_id", "value_a")]),
+                ("row_b", [Cell("column_id", "value_b")]),
+            ]
+        )
+        assert len(results) == 2
+        bodies = {
+            call.request.url: json.loads(call.request.body)
+            for call in mocked_responses.calls
+            if call.request.method == "PUT"
+        }
+        assert bodies[row_url + "row_b"] == {
+            "row": {"cells": [{"column": "column_id", "value": "value_b"}]}
+        }
+
+    def test_delete_rows(self, main_table, mock_json_response, mocked_responses):
+        mock_json_response(
+            BASE_URL + "/docs/doc_id/tables/table_id/rows",
+            "empty.json",
+            method="DELETE",
+            status=202,
+        )
+        row = main_table.rows()[0]
+
+        results = main_table.delete_rows([row, "row_a", "row_b"], chunk_size=2)
+        assert len(results) == 2
+        bodies = [
+            json.loads(call.request.body)
+            for call in mocked_responses.calls
+            if call.request.method == "DELETE"
+        ]
+        assert bodies == [{"rowIds": [row.id, "row_a"]}, {"rowIds": ["row_b"]}]
+
     def test_upsert_existing_rows(self, main_table):
         columns = main_table.columns()
         key_column = columns[0]
 
         result = main_table.upsert_rows(
             [
-                [Cell(column, f"value-{str(row)}-{column.name}") for column in columns]
+                [Cell(column, f"value-{row}-{column.name}") for column in columns]
                 for row in range(1, 11)
             ]
         )
@@ -123,3 +338,7 @@ class TestTable:
             updated_row.get_cell_by_column_id(columns[1].id).value
             == cell_to_update_2.value
         )
+
+    def test_timestamps(self, main_table):
+        assert main_table.created_at == dt.datetime(2020, 1, 1, tzinfo=dt.timezone.utc)
+        assert main_table._created_at == "2020-01-01T00:00:00.000Z"